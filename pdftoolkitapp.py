@@ -1,40 +1,932 @@
+import datetime
+import hashlib
+import importlib
+import io
 import os
+import shutil
+import tempfile
+import threading
 import tkinter as tk
+import zipfile
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+from functools import lru_cache
+from itertools import chain, repeat
+from multiprocessing import Pipe, Process, freeze_support
 from tkinter import filedialog, messagebox, simpledialog
 from tkinter import ttk
-from typing import Optional, List, Tuple
-
-import pandas as pd
+from typing import TYPE_CHECKING, Iterable, Optional, List, Tuple, Union
+from xml.etree import ElementTree
 
 import fitz  # PyMuPDF, used for PDF compression
-from pdf2docx import Converter
-import img2pdf
-from PIL import Image, ImageTk
-from pdf2image import convert_from_path
-from PyPDF2 import PdfMerger, PdfReader, PdfWriter
-import pdfplumber
-
-# Additional imports for extended functionality
-# Word→PDF conversion may use docx2pdf if available
-try:
-    from docx2pdf import convert as docx2pdf_convert  # type: ignore
-except Exception:
-    docx2pdf_convert = None  # type: ignore
-
-# Fallback COM automation for Word→PDF
-try:
-    import win32com.client  # type: ignore
-except Exception:
-    win32com = None  # type: ignore
-
-# Use pikepdf for encryption/decryption if available
-try:
-    import pikepdf  # type: ignore
-except Exception:
-    pikepdf = None  # type: ignore
-
-from reportlab.pdfgen import canvas  # type: ignore
-from reportlab.lib.pagesizes import letter as reportlab_letter  # type: ignore
+from PIL import Image, ImageOps, ImageTk
+
+if TYPE_CHECKING:
+    import numpy as np  # imported lazily where it is used
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pdftoolkit")
+# Rendered first-page previews, keyed by file path, mtime, size and canvas size
+PREVIEW_CACHE_DIR = os.path.join(CACHE_DIR, "previews")
+# Theme icons already resized to the size the toolbar uses
+ICON_CACHE_DIR = os.path.join(CACHE_DIR, "icons")
+# Least recently used previews are pruned once the cache grows past this
+PREVIEW_CACHE_MAX_BYTES = 100 * 1024 * 1024
+# Text extracted by pdf_to_text, keyed by the PDF's path, mtime and size
+TEXT_CACHE_DIR = os.path.join(CACHE_DIR, "text")
+TEXT_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+# compress_pdf only rasterizes pages whose images take at least this much
+# space; text and vector pages are left as they are
+MIN_IMAGE_BYTES_FOR_LOSSY = 50 * 1024
+
+# pdfplumber settings for detecting ruled tables in pdf_to_excel
+TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "intersection_tolerance": 5,
+    "snap_tolerance": 3,
+    "join_tolerance": 3,
+    "edge_min_length": 3,
+}
+
+
+@lru_cache(maxsize=None)
+def _optional_import(name: str):
+    """
+    Import and return module ``name``, or None if it is not installed.
+
+    Optional back ends (pikepdf, docx2pdf, the pywin32 COM modules) are
+    only imported the first time an action needs them, so they add
+    nothing to start-up.  The result, including a failed import, is cached.
+    """
+    try:
+        return importlib.import_module(name)
+    except Exception:
+        return None
+
+
+def _file_digest(path: str) -> str:
+    """Return a BLAKE2b hex digest of the file's contents, read in blocks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _prune_cache(directory: str, max_bytes: int) -> None:
+    """
+    Delete the least recently used files in ``directory`` until the
+    total size is at most ``max_bytes``.
+
+    Recency is the file's modification time, which callers bump on every
+    cache hit (access times are often not updated).
+    """
+    try:
+        entries = [e for e in os.scandir(directory) if e.is_file()]
+    except OSError:
+        return
+    stats = [(e.stat().st_mtime, e.stat().st_size, e.path) for e in entries]
+    total = sum(size for _, size, _ in stats)
+    for _, size, path in sorted(stats):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+@lru_cache(maxsize=None)
+def _icon(name: str, size: Tuple[int, int]) -> Image.Image:
+    """
+    Load ``<name>.png`` from the working directory, resized to ``size``.
+
+    The resized copy is kept under :data:`ICON_CACHE_DIR` and reused on
+    later launches for as long as the source file is unchanged.
+    """
+    src_path = f"{name}.png"
+    cache_path = os.path.join(
+        ICON_CACHE_DIR,
+        f"{name}_{size[0]}x{size[1]}_{os.stat(src_path).st_mtime_ns}.png",
+    )
+    if os.path.exists(cache_path):
+        with Image.open(cache_path) as cached:
+            cached.load()
+        return cached
+    with Image.open(src_path) as img:
+        resized = img.resize(size, Image.Resampling.LANCZOS)
+    try:
+        os.makedirs(ICON_CACHE_DIR, exist_ok=True)
+        resized.save(cache_path, format="PNG", optimize=True)
+    except OSError:
+        # The cache is only an optimisation
+        pass
+    return resized
+
+
+def _compress_one(
+    pdf_path: str,
+    quality: int = 80,
+    dpi: int = 150,
+    output_path: Optional[str] = None,
+    max_lossy_pages: Optional[int] = None,
+    workers: int = 1,
+) -> Tuple[int, int, str, bool]:
+    """
+    Compress a single PDF and return ``(in_size, out_size, out_path, skipped)``.
+
+    A lossless PyMuPDF save (``garbage=4``, deflated streams, object
+    streams) is tried first, followed by a pikepdf save that recompresses
+    every flate stream at level 9 when pikepdf is installed.  If neither
+    shrinks the file, pages whose images take at least
+    :data:`MIN_IMAGE_BYTES_FOR_LOSSY` are rasterized at ``dpi`` and
+    re-inserted as JPEGs of the given ``quality``, unless the document
+    has more than ``max_lossy_pages`` pages, in which case the
+    lossy pass is skipped and ``skipped`` is True.  With ``workers`` > 1,
+    the lossy pass renders pages in that many worker processes.  This
+    function is kept at module level and free of Tk calls so it can run in
+    a worker process itself (with the default ``workers=1``).
+    """
+    if output_path is None:
+        output_path = os.path.splitext(pdf_path)[0] + "_compressed.pdf"
+    input_size = os.path.getsize(pdf_path)
+    # One handle serves both passes, so the input is parsed only once.  The
+    # garbage-collecting save renumbers the open document's objects, so
+    # xrefs used later must come from this handle, never from another
+    # handle on the input file.
+    with fitz.open(pdf_path) as doc, ExitStack() as stack:
+        page_count = doc.page_count
+        # First attempt: lossless compression using garbage collection,
+        # deflate and object streams
+        doc.save(
+            output_path,
+            garbage=4,
+            deflate=True,
+            deflate_images=True,
+            deflate_fonts=True,
+            use_objstms=1,
+        )
+        fitz.TOOLS.store_shrink(100)
+        out_size = os.path.getsize(output_path)
+        if out_size < input_size:
+            return input_size, out_size, output_path, False
+        # Second lossless attempt: MuPDF keeps already-deflated streams as
+        # they are, while pikepdf can recompress them at the highest level.
+        # This is cheap next to rasterizing every page.
+        pikepdf = _optional_import("pikepdf")
+        if pikepdf is not None:
+            from pikepdf import settings as pikepdf_settings
+
+            tmp_path = output_path + ".tmp"
+            try:
+                # The level is process-wide, so it is put back afterwards
+                pikepdf_settings.set_flate_compression_level(9)
+                with pikepdf.Pdf.open(pdf_path) as pdf:
+                    pdf.save(
+                        tmp_path,
+                        compress_streams=True,
+                        recompress_flate=True,
+                        object_stream_mode=pikepdf.ObjectStreamMode.generate,
+                    )
+                if os.path.getsize(tmp_path) < input_size:
+                    os.replace(tmp_path, output_path)
+                    return input_size, os.path.getsize(output_path), output_path, False
+            except (pikepdf.PdfError, OSError):
+                # pikepdf is only a second try; the lossy pass below is the
+                # fallback when it cannot read or write the file
+                pass
+            finally:
+                # pikepdf has no getter for the level; nothing else here
+                # changes it, so this restores zlib's default (-1)
+                pikepdf_settings.set_flate_compression_level(-1)
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        if max_lossy_pages is not None and page_count > max_lossy_pages:
+            return input_size, out_size, output_path, True
+
+        # Lossy fallback: rasterize pages and re-insert them as JPEGs.  Only
+        # pages carrying a sizeable amount of image data are worth it; text
+        # and vector pages are small already and would grow as a raster.
+        pages = [
+            pno for pno in range(page_count)
+            if _page_image_bytes(doc, pno) >= MIN_IMAGE_BYTES_FOR_LOSSY
+        ]
+        if not pages:
+            return input_size, out_size, output_path, False
+        # MuPDF keeps decoded resources in a global store (capped at 256 MB
+        # by PyMuPDF), which is emptied after every page to keep memory
+        # flat.  Rendering is the expensive part, so for larger documents
+        # it is spread over worker processes (MuPDF is not thread-safe)
+        # that return JPEG bytes in page order; the images are inserted here.
+        MIN_PAGES_FOR_PARALLEL = 8
+        if workers > 1 and len(pages) > MIN_PAGES_FOR_PARALLEL:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            chunks = _page_chunks(0, len(pages), workers * 4)
+            jpegs = chain.from_iterable(
+                executor.map(
+                    _render_jpeg_pages,
+                    repeat(pdf_path),
+                    [pages[start:stop] for start, stop in chunks],
+                    repeat(dpi),
+                    repeat(quality),
+                )
+            )
+        else:
+            jpegs = _iter_page_jpegs(doc, pages, dpi, quality)
+        for i, (is_scan, jpeg_bytes) in zip(pages, jpegs):
+            page = doc[i]
+            if is_scan:
+                # Scanned page: swap the image in place and keep the page's
+                # content stream, including any OCR text layer.  The xref is
+                # looked up again here because worker processes number
+                # objects as in the input file, not as in this document.
+                xref = _scan_image_xref(doc, i)
+                if xref and jpeg_bytes is not None:
+                    page.replace_image(xref, stream=jpeg_bytes)
+            else:
+                # The raster replaces everything the page drew, so drop its
+                # old contents and resources; the save then collects any
+                # objects no other page still uses.
+                doc.xref_set_key(page.xref, "Contents", "null")
+                doc.xref_set_key(page.xref, "Resources", "<<>>")
+                page.insert_image(page.rect, stream=jpeg_bytes)  # type: ignore[attr-defined]
+            # Release MuPDF's cached resources for the page we just replaced
+            fitz.TOOLS.store_shrink(100)
+        # replace_image leaves a second resource entry pointing at a copy of
+        # the new JPEG; garbage=4 merges identical streams so it is stored once
+        tmp_path = output_path + ".tmp"
+        try:
+            doc.save(tmp_path, garbage=4, deflate=True)
+            # Keep the lossless result unless the lossy one actually wins
+            if os.path.getsize(tmp_path) < out_size:
+                os.replace(tmp_path, output_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    return input_size, os.path.getsize(output_path), output_path, False
+
+
+def _page_image_bytes(doc, pno: int) -> int:
+    """
+    Return the combined stored size of the images drawn on page ``pno``.
+
+    Sizes are read from each image's /Length entry where possible, so
+    image data is normally neither read nor decoded.
+    """
+    total = 0
+    for img in doc.get_page_images(pno):
+        kind, value = doc.xref_get_key(img[0], "Length")
+        if kind == "int":
+            total += int(value)
+        else:
+            # Length stored as an indirect object; read the raw stream
+            total += len(doc.xref_stream_raw(img[0]) or b"")
+    return total
+
+
+def _scan_image_xref(doc, pno: int) -> int:
+    """
+    Return the xref of the image that makes up page ``pno``, or 0.
+
+    A page counts as a scan when its only image is drawn once, without a
+    soft mask, over at least 90% of an unrotated page.
+    """
+    page = doc[pno]
+    images = page.get_images()
+    if len(images) != 1 or images[0][1] or page.rotation:
+        return 0
+    xref = images[0][0]
+    rects = page.get_image_rects(xref)
+    if len(rects) != 1:
+        return 0
+    if (rects[0] & page.rect).get_area() < 0.9 * page.rect.get_area():
+        return 0
+    return xref
+
+
+def _scan_image_jpeg(doc, xref: int, rect, dpi: int, quality: int) -> Optional[bytes]:
+    """
+    Re-encode image ``xref``, drawn over ``rect``, as a JPEG of at most ``dpi``.
+
+    Returns None when the result would not be smaller than the stored image.
+    """
+    pix = fitz.Pixmap(doc, xref)
+    if pix.alpha:
+        pix = fitz.Pixmap(pix, 0)
+    if pix.colorspace is None or pix.colorspace.n not in (1, 3):
+        pix = fitz.Pixmap(fitz.csRGB, pix)
+    width = max(1, round(rect.width * dpi / 72))
+    height = max(1, round(rect.height * dpi / 72))
+    if pix.width > width and pix.height > height:
+        pix = fitz.Pixmap(pix, width, height, None)
+    jpeg_bytes = pix.tobytes("jpg", jpg_quality=quality)
+    if len(jpeg_bytes) >= len(doc.xref_stream_raw(xref) or b""):
+        return None
+    return jpeg_bytes
+
+
+def _iter_page_jpegs(doc, pages: Iterable[int], dpi: int, quality: int):
+    """
+    Yield ``(is_scan, jpeg_bytes)`` for the given pages of an open fitz document.
+
+    For scanned pages (see :func:`_scan_image_xref`) ``is_scan`` is True
+    and ``jpeg_bytes`` is the page image re-encoded, or None if
+    re-encoding would not make it smaller.  Other pages are rendered whole
+    at ``dpi``.  No xrefs are returned: they are only meaningful for the
+    handle that produced them, and worker processes open their own.
+    MuPDF encodes the JPEGs itself, so no PIL image or
+    intermediate buffer is involved; only one raster is held at a time.
+    """
+    # Compute zoom factor based on DPI once; it is the same for every page
+    zoom = dpi / 72.0
+    mat = fitz.Matrix(zoom, zoom)
+    for i in pages:
+        page = doc[i]
+        xref = _scan_image_xref(doc, i)
+        if xref:
+            rect = page.get_image_rects(xref)[0]
+            yield True, _scan_image_jpeg(doc, xref, rect, dpi, quality)
+            fitz.TOOLS.store_shrink(100)
+            continue
+        pix = page.get_pixmap(matrix=mat, alpha=False)  # type: ignore[attr-defined]
+        jpeg_bytes = pix.tobytes("jpg", jpg_quality=quality)
+        pix = None
+        fitz.TOOLS.store_shrink(100)
+        yield False, jpeg_bytes
+
+
+def _render_jpeg_pages(
+    pdf_path: str, pages: List[int], dpi: int, quality: int
+) -> List[Tuple[bool, Optional[bytes]]]:
+    """Run :func:`_iter_page_jpegs` on ``pages`` of ``pdf_path`` (worker process)."""
+    with fitz.open(pdf_path) as doc:
+        return list(_iter_page_jpegs(doc, pages, dpi, quality))
+
+
+def _prepare_for_jpeg(img: Image.Image) -> Image.Image:
+    """
+    Return ``img`` upright and in a mode JPEG can store (RGB or L).
+
+    An EXIF orientation tag (as written by phone cameras) is applied to the
+    pixels, since the re-encoded JPEG does not carry the tag over.  RGB
+    and grayscale images are otherwise returned as-is.  Images with
+    transparency are composited onto a white background, since a plain
+    ``convert("RGB")`` would drop the alpha channel and turn transparent
+    areas black.
+    """
+    ImageOps.exif_transpose(img, in_place=True)
+    if img.mode in ("RGB", "L"):
+        return img
+    if img.mode in ("LA", "PA") or (img.mode == "P" and "transparency" in img.info):
+        img = img.convert("RGBA")
+    if img.mode == "RGBA":
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        background.paste(img, mask=img.getchannel("A"))
+        return background
+    return img.convert("RGB")
+
+
+def _block_ssim(a: "np.ndarray", b: "np.ndarray", block: int = 8) -> float:
+    """
+    Mean SSIM of two equally sized grayscale arrays.
+
+    SSIM is evaluated over non-overlapping ``block`` x ``block`` tiles
+    rather than a sliding Gaussian window.  That is cheaper and needs only
+    numpy, and it is accurate enough to compare JPEG qualities of one image.
+    """
+    import numpy as np
+
+    h = a.shape[0] // block * block
+    w = a.shape[1] // block * block
+    if h == 0 or w == 0:
+        return 1.0
+
+    def tiles(arr: "np.ndarray") -> "np.ndarray":
+        arr = arr[:h, :w].astype(np.float64)
+        arr = arr.reshape(h // block, block, w // block, block).swapaxes(1, 2)
+        return arr.reshape(-1, block * block)
+
+    x, y = tiles(a), tiles(b)
+    mx, my = x.mean(axis=1), y.mean(axis=1)
+    vx, vy = x.var(axis=1), y.var(axis=1)
+    cov = ((x - mx[:, None]) * (y - my[:, None])).mean(axis=1)
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+    ssim = ((2 * mx * my + c1) * (2 * cov + c2)) / (
+        (mx ** 2 + my ** 2 + c1) * (vx + vy + c2)
+    )
+    return float(ssim.mean())
+
+
+def _pick_jpeg_quality(
+    img: Image.Image, min_quality: int, max_quality: int, target_ssim: float
+) -> int:
+    """
+    Return the lowest JPEG quality in ``[min_quality, max_quality]`` whose
+    result still has an SSIM of at least ``target_ssim`` against ``img``.
+
+    The range is binary-searched, so 55-85 takes about five trial
+    encodes.  Each trial is a plain encode and decode without
+    ``optimize``/``progressive``, which do not change the decoded pixels.
+    """
+    import numpy as np
+
+    reference = np.asarray(img.convert("L"))
+    best = max_quality
+    lo, hi = min_quality, max_quality
+    while lo <= hi:
+        q = (lo + hi) // 2
+        with io.BytesIO() as trial:
+            img.save(trial, format="JPEG", quality=q)
+            trial.seek(0)
+            with Image.open(trial) as decoded:
+                score = _block_ssim(reference, np.asarray(decoded.convert("L")))
+        if score >= target_ssim:
+            best, hi = q, q - 1
+        else:
+            lo = q + 1
+    return best
+
+
+def _image_for_pdf(path: str) -> Union[str, bytes, None]:
+    """
+    Return what img2pdf should embed for the image at ``path``.
+
+    RGB or grayscale JPEGs are returned as their path, so img2pdf copies
+    the JPEG data into the PDF without decoding it (Image.open only parses
+    the header, so checking the format is cheap).  Other images are
+    returned as JPEG bytes re-encoded at quality 85, and unreadable files
+    as None.
+    """
+    try:
+        with Image.open(path) as img:
+            if img.format == "JPEG" and img.mode in ("RGB", "L"):
+                return path
+            img = _prepare_for_jpeg(img)
+            # Compress image to JPEG
+            with io.BytesIO() as buf:
+                img.save(buf, format="JPEG", quality=85, optimize=True, progressive=True)
+                return buf.getvalue()
+    except Exception:
+        return None
+
+
+def _images_for_pdf(img_paths: List[str]) -> List[Union[str, bytes]]:
+    """
+    Prepare ``img_paths`` for img2pdf with :func:`_image_for_pdf`, in order.
+
+    Pillow releases the GIL while decoding and encoding, so the images are
+    prepared on a thread pool.  Unreadable images are left out.
+    """
+    if not img_paths:
+        return []
+    workers = max(1, min(os.cpu_count() or 1, len(img_paths)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return [item for item in executor.map(_image_for_pdf, img_paths) if item is not None]
+
+
+def _compress_image(
+    path: str,
+    quality: int,
+    scale: int,
+    buf: io.BytesIO,
+    target_ssim: Optional[float] = None,
+    min_quality: int = 55,
+    optimize: bool = False,
+) -> str:
+    """
+    Save ``path`` as ``<name>_compressed.jpg`` and return the output path.
+
+    The image is converted to RGB if needed, scaled by ``scale`` percent
+    and encoded into ``buf``, which is rewound first so one buffer can be
+    reused across many images.  If ``target_ssim`` is given, ``quality``
+    is an upper bound and the lowest quality down to ``min_quality`` that
+    still meets the SSIM target is used instead.  ``optimize`` turns on
+    libjpeg's optimized Huffman tables and progressive scans, which make
+    the file a few percent smaller but roughly double the encode time.
+    """
+    with Image.open(path) as img:
+        full_size = img.size
+        if scale < 100:
+            # JPEGs can be decoded straight at 1/2, 1/4 or 1/8 size (never
+            # below the requested size), which is far cheaper than decoding
+            # the full image only to shrink it.  Other formats ignore this.
+            img.draft(
+                img.mode,
+                (max(1, img.width * scale // 100), max(1, img.height * scale // 100)),
+            )
+        decoded_size = img.size
+        # Rotate upright and flatten any alpha channel onto white
+        img = _prepare_for_jpeg(img)
+        # Apply scaling if necessary
+        if scale != 100:
+            if img.size != decoded_size:
+                # EXIF orientation swapped width and height
+                full_size = full_size[::-1]
+            new_size = (
+                max(1, int(full_size[0] * scale / 100)),
+                max(1, int(full_size[1] * scale / 100)),
+            )
+            img = img.resize(new_size, Image.Resampling.LANCZOS)
+        if target_ssim is not None:
+            quality = _pick_jpeg_quality(img, min_quality, quality, target_ssim)
+        buf.seek(0)
+        buf.truncate()
+        # Save as JPEG with specified quality and 4:2:0 chroma subsampling
+        img.save(
+            buf,
+            format="JPEG",
+            quality=quality,
+            subsampling=2,
+            optimize=optimize,
+            progressive=optimize,
+        )
+    out_path = f"{os.path.splitext(path)[0]}_compressed.jpg"
+    with open(out_path, "wb") as fh:
+        fh.write(buf.getbuffer())
+    return out_path
+
+
+def _pdf_page_count(pdf_path: str) -> Optional[int]:
+    """
+    Return the number of pages in ``pdf_path``, or None if it can't be read.
+
+    MuPDF loads pages lazily, so opening the document only reads its
+    cross-reference table and page tree, which is all the page range
+    prompts need before the conversion itself starts.
+    """
+    try:
+        with fitz.open(pdf_path) as doc:
+            return doc.page_count
+    except Exception:
+        return None
+
+
+def _read_sheets(excel_path: str) -> List[Tuple[str, List[List[str]], List[int]]]:
+    """
+    Read every sheet of a workbook as ``(name, rows, max_lengths)``.
+
+    ``rows`` holds each cell as a string with the header row first, and
+    ``max_lengths`` is the longest cell (in characters, at least 1) of
+    every column.  ``.xlsx`` files are streamed row by row with openpyxl's
+    read-only mode so no DataFrame is built, one sheet per worker process
+    when the workbook is large and has several sheets; legacy ``.xls``
+    files, which openpyxl cannot open, are still read through pandas.
+    Empty sheets are left out.
+    """
+    sheets: List[Tuple[str, List[List[str]], List[int]]] = []
+    if os.path.splitext(excel_path)[1].lower() == ".xls":
+        import pandas as pd
+
+        for name, df in pd.read_excel(excel_path, sheet_name=None).items():
+            if df.columns.empty:
+                continue
+            header = [str(col) for col in df.columns]
+            # Missing values become "" while the frame is copied out, and
+            # each cell is turned into a string exactly once
+            rows = [header] + [
+                [_cell_text(v) for v in values]
+                for values in df.to_numpy(dtype=object, na_value="")
+            ]
+            max_lengths = [max(1, max(map(len, col))) for col in zip(*rows)]
+            sheets.append((str(name), rows, max_lengths))
+        return sheets
+
+    # Every worker reloads the workbook and its shared strings and sends
+    # its rows back pickled, which only pays off for large workbooks
+    MIN_BYTES_FOR_PARALLEL = 2 * 1024 * 1024
+    sheet_count = 0
+    if os.path.getsize(excel_path) >= MIN_BYTES_FOR_PARALLEL:
+        sheet_count = _xlsx_sheet_count(excel_path)
+    workers = min(os.cpu_count() or 1, 4, sheet_count)
+    if workers > 1:
+        # Converting cells to strings is pure Python, so large workbooks
+        # with several sheets are read one sheet per worker process
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(_read_xlsx_sheet_at, repeat(excel_path), range(sheet_count))
+            )
+    else:
+        from openpyxl import load_workbook
+
+        wb = load_workbook(excel_path, read_only=True, data_only=True)
+        try:
+            results = [_read_xlsx_sheet(ws) for ws in wb.worksheets]
+        finally:
+            wb.close()
+    return [sheet for sheet in results if sheet is not None]
+
+
+def _cell_text(value) -> str:
+    """
+    Return a spreadsheet cell value as the text shown in the PDF table.
+
+    Dates without a time of day are written as ``YYYY-MM-DD``, as pandas
+    did when sheets were read through DataFrames; everything else uses
+    ``str``.
+    """
+    if isinstance(value, datetime.datetime):
+        if value.time() == datetime.time():
+            return value.date().isoformat()
+        return str(value)
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return str(value)
+
+
+def _xlsx_sheet_count(excel_path: str) -> int:
+    """
+    Count the sheets listed in ``xl/workbook.xml`` of an ``.xlsx`` file.
+
+    Only that small part of the archive is read, so no worksheet or shared
+    string is parsed.  Chart sheets are counted too.  Returns 0 if the
+    file cannot be read this way.
+    """
+    try:
+        with zipfile.ZipFile(excel_path) as archive:
+            root = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+    except (OSError, KeyError, zipfile.BadZipFile, ElementTree.ParseError):
+        return 0
+    return sum(1 for elem in root.iter() if elem.tag.rsplit("}", 1)[-1] == "sheet")
+
+
+def _read_xlsx_sheet(ws) -> Optional[Tuple[str, List[List[str]], List[int]]]:
+    """
+    Read one openpyxl worksheet as ``(name, rows, max_lengths)``.
+
+    Returns None for an empty sheet.  See :func:`_read_sheets`.
+    """
+    rows = []
+    max_lengths: List[int] = []
+    # The stored <dimension> can be stale or wrong; without this, read-only
+    # mode stops at it and silently drops the cells outside
+    ws.reset_dimensions()
+    # Convert cells and track column widths in the same pass
+    for values in ws.iter_rows(values_only=True):
+        row = ["" if v is None else _cell_text(v) for v in values]
+        rows.append(row)
+        if len(row) > len(max_lengths):
+            max_lengths.extend([0] * (len(row) - len(max_lengths)))
+        max_lengths[: len(row)] = map(max, max_lengths, map(len, row))
+    # Formatting can leave empty rows at the end of the sheet's range
+    while rows and not any(rows[-1]):
+        rows.pop()
+    # ... and empty columns on the right, e.g. a formatted but blank cell
+    while max_lengths and not max_lengths[-1]:
+        max_lengths.pop()
+    if not rows or not max_lengths:
+        return None
+    width = len(max_lengths)
+    for row in rows:
+        if len(row) < width:
+            row.extend([""] * (width - len(row)))
+        else:
+            del row[width:]
+    return ws.title, rows, [max(n, 1) for n in max_lengths]
+
+
+def _read_xlsx_sheet_at(
+    excel_path: str, index: int
+) -> Optional[Tuple[str, List[List[str]], List[int]]]:
+    """
+    Open ``excel_path`` read-only and read its ``index``-th worksheet
+    (worker process).
+
+    Returns None when ``index`` is past the last worksheet, which happens
+    when :func:`_xlsx_sheet_count` also counted chart sheets.
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(excel_path, read_only=True, data_only=True)
+    try:
+        if index >= len(wb.worksheets):
+            return None
+        return _read_xlsx_sheet(wb.worksheets[index])
+    finally:
+        wb.close()
+
+
+def _render_pages(
+    pdf_path: str,
+    start: int,
+    stop: Optional[int],
+    folder: str,
+    dpi: int = 300,
+    compress_level: int = 6,
+) -> int:
+    """
+    Render pages ``[start, stop)`` (0-based) to ``page_<n>.png`` in ``folder``.
+
+    MuPDF renders on this thread while Pillow encodes the PNGs on a small
+    thread pool; the encoder releases the GIL, so the next page is drawn
+    while the previous one is compressed.  MuPDF is not thread-safe, so
+    the pixels are copied out of the pixmap here and the encoder threads
+    only see plain bytes.  At most two rendered pages wait for the encoder
+    at a time.  ``compress_level`` is the zlib level of
+    the PNGs (1 fastest, 9 smallest).  Returns the number of images saved.
+    """
+    MAX_PENDING = 2
+    zoom = dpi / 72.0
+    mat = fitz.Matrix(zoom, zoom)
+    saved = 0
+    with fitz.open(pdf_path) as doc, ThreadPoolExecutor(max_workers=MAX_PENDING) as encoder:
+        stop = doc.page_count if stop is None else min(stop, doc.page_count)
+        pending = deque()
+        for i in range(start, stop):
+            pix = doc.load_page(i).get_pixmap(matrix=mat, alpha=False)
+            if len(pending) >= MAX_PENDING:
+                pending.popleft().result()
+            pending.append(
+                encoder.submit(
+                    _save_png,
+                    pix.samples,
+                    pix.width,
+                    pix.height,
+                    pix.stride,
+                    os.path.join(folder, f"page_{i + 1}.png"),
+                    compress_level,
+                )
+            )
+            pix = None
+            fitz.TOOLS.store_shrink(100)
+            saved += 1
+        for future in pending:
+            future.result()
+    return saved
+
+
+def _save_png(
+    samples: bytes,
+    width: int,
+    height: int,
+    stride: int,
+    path: str,
+    compress_level: int = 6,
+) -> None:
+    """
+    Save raw RGB ``samples`` (rows ``stride`` bytes apart) as a PNG.
+
+    At ``compress_level`` 9 Pillow's ``optimize`` is also enabled, which
+    spends more time searching for the smallest encoding.
+    """
+    img = Image.frombuffer(
+        "RGB", (width, height), samples, "raw", "RGB", stride, 1
+    )
+    img.save(
+        path,
+        format="PNG",
+        compress_level=compress_level,
+        optimize=compress_level >= 9,
+    )
+
+
+def _convert_pdf_to_docx(
+    pdf_path: str, docx_path: str, start: int, stop: int, conn
+) -> None:
+    """
+    Convert pages ``[start, stop)`` of ``pdf_path`` to ``docx_path`` with
+    pdf2docx (child process).
+
+    None is sent on ``conn`` on success, or the error message on failure.
+    """
+    try:
+        from pdf2docx import Converter
+
+        cv = Converter(pdf_path)
+        try:
+            # pdf2docx treats ``end`` as exclusive
+            cv.convert(docx_path, start=start, end=stop)
+        finally:
+            cv.close()
+        conn.send(None)
+    except Exception as e:  # noqa: BLE001
+        conn.send(str(e))
+    finally:
+        conn.close()
+
+
+@lru_cache(maxsize=8)
+def _watermark_pdf(text: str) -> bytes:
+    """
+    Return a one-page letter-size PDF with ``text`` drawn diagonally.
+
+    The page is built with reportlab.  Results are cached, so applying the
+    same watermark to several files builds the page only once.
+    """
+    from reportlab.pdfgen import canvas  # type: ignore
+    from reportlab.lib.pagesizes import letter as reportlab_letter  # type: ignore
+
+    packet = io.BytesIO()
+    c = canvas.Canvas(packet, pagesize=reportlab_letter)
+    width, height = reportlab_letter
+    c.setFont("Helvetica", 40)
+    # Semi-transparent grey, in DeviceGray rather than three equal RGB values
+    c.setFillGray(0.6)
+    c.setFillAlpha(0.3)
+    c.saveState()
+    # rotate text at an angle and center
+    c.translate(width / 2, height / 2)
+    c.rotate(45)
+    c.drawCentredString(0, 0, text)
+    c.restoreState()
+    c.showPage()
+    c.save()
+    return packet.getvalue()
+
+
+def _page_chunks(start: int, stop: int, parts: int) -> List[Tuple[int, int]]:
+    """Split the page index range ``[start, stop)`` into contiguous chunks."""
+    size = max(1, -(-(stop - start) // max(parts, 1)))
+    return [(i, min(i + size, stop)) for i in range(start, stop, size)]
+
+
+def _bounded_map(executor, fn, *iterables, window: int):
+    """
+    Like ``executor.map`` but with at most ``window`` calls in flight.
+
+    Results are yielded in submission order.  ``executor.map`` submits
+    every call up front, so when the consumer is slower than the workers
+    finished results pile up in memory; here the next call is only
+    submitted once the oldest result has been taken.
+    """
+    pending = deque()
+    for args in zip(*iterables):
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, *args))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _iter_text_range(pdf_path: str, start: int = 0, stop: Optional[int] = None):
+    """
+    Yield the text of pages ``[start, stop)`` (0-based) using PyMuPDF.
+
+    Pages whose text cannot be extracted are skipped.
+    """
+    with fitz.open(pdf_path) as doc:
+        stop = doc.page_count if stop is None else min(stop, doc.page_count)
+        for i in range(start, stop):
+            try:
+                yield doc.load_page(i).get_text("text")
+            except Exception:
+                continue
+    fitz.TOOLS.store_shrink(100)
+
+
+def _extract_text_range(
+    pdf_path: str, start: int = 0, stop: Optional[int] = None
+) -> List[str]:
+    """
+    Return the text of pages ``[start, stop)`` as a list.
+
+    This is a module-level function so page ranges can be handed to worker
+    processes, which must send back a picklable result.
+    """
+    return list(_iter_text_range(pdf_path, start, stop))
+
+
+def _iter_tables_range(pdf_path: str, start: int = 0, stop: Optional[int] = None):
+    """
+    Yield the non-empty tables found on pages ``[start, stop)`` (0-based).
+
+    Tables are detected with pdfplumber's line strategy and yielded as
+    plain row lists. Pages without a text layer (blank or scanned pages)
+    cannot hold a table with any content, so PyMuPDF is used to find and
+    skip them before pdfplumber parses the page.
+    """
+    import pdfplumber
+
+    with fitz.open(pdf_path) as doc:
+        stop = doc.page_count if stop is None else min(stop, doc.page_count)
+        has_text = [
+            bool(doc.load_page(i).get_text("text").strip())
+            for i in range(start, stop)
+        ]
+    fitz.TOOLS.store_shrink(100)
+
+    with pdfplumber.open(pdf_path) as pdf:
+        for idx in range(start, stop):
+            if not has_text[idx - start]:
+                continue
+            page = pdf.pages[idx]
+            # Attempt to extract tables using line detection
+            tables = page.extract_tables(TABLE_SETTINGS)
+            yield from (table for table in tables if table)
+
+
+def _extract_tables_range(
+    pdf_path: str, start: int = 0, stop: Optional[int] = None
+) -> List[List[List[Optional[str]]]]:
+    """
+    Return the non-empty tables found on pages ``[start, stop)`` as a list.
+
+    This is a module-level function so page ranges can be handed to worker
+    processes, which must send back a picklable result.
+    """
+    return list(_iter_tables_range(pdf_path, start, stop))
 
 
 class PDFToolkitApp:
@@ -78,8 +970,12 @@ class PDFToolkitApp:
         # Load icons for light/dark mode toggle
         # Note: these image files (sun.png and moon.png) need to exist in the
         # working directory.  Resize them for the button.
-        self.sun_image = ImageTk.PhotoImage(Image.open("sun.png").resize((24, 24)))
-        self.moon_image = ImageTk.PhotoImage(Image.open("moon.png").resize((24, 24)))
+        self._icons = {
+            name: ImageTk.PhotoImage(_icon(name, (24, 24)))
+            for name in ("sun", "moon")
+        }
+        # Recently shown image previews, keyed by (path, mtime, size, canvas size)
+        self._image_previews: "OrderedDict[tuple, ImageTk.PhotoImage]" = OrderedDict()
 
         # Create sidebar for actions with a scrollable area
         self.sidebar = tk.Frame(root, bg=self.light_theme["sidebar_bg"], width=200)
@@ -92,7 +988,7 @@ class PDFToolkitApp:
         # Toggle button for switching themes; placed in top frame so it stays visible
         self.toggle_btn = tk.Label(
             self.top_sidebar_frame,
-            image=self.sun_image,
+            image=self._icons["sun"],
             cursor="hand2",
             bg="#f0f0f0",
         )
@@ -114,6 +1010,31 @@ class PDFToolkitApp:
         self.toggle_btn.bind(
             "<Leave>", lambda e: self.toggle_btn_tooltip.place_forget()
         )
+        # When ticked, cached results (see TEXT_CACHE_DIR) are ignored and
+        # rebuilt from the PDF
+        self.refresh_cache = tk.BooleanVar(value=False)
+        self.refresh_cache_check = tk.Checkbutton(
+            self.top_sidebar_frame,
+            text="Refresh cache",
+            variable=self.refresh_cache,
+            font=("Segoe UI", 9),
+            bd=0,
+            highlightthickness=0,
+            cursor="hand2",
+        )
+        self.refresh_cache_check.pack(padx=10, pady=(0, 5), anchor="w")
+        # Trade encode speed for slightly smaller files in compress_images
+        self.optimize_jpeg = tk.BooleanVar(value=False)
+        self.optimize_jpeg_check = tk.Checkbutton(
+            self.top_sidebar_frame,
+            text="Smallest JPEGs (slower)",
+            variable=self.optimize_jpeg,
+            font=("Segoe UI", 9),
+            bd=0,
+            highlightthickness=0,
+            cursor="hand2",
+        )
+        self.optimize_jpeg_check.pack(padx=10, pady=(0, 5), anchor="w")
 
         # Canvas and scrollbar to make the button list scrollable. This allows the sidebar to
         # accommodate many buttons even in a small window.
@@ -135,13 +1056,36 @@ class PDFToolkitApp:
         self.sidebar_canvas.create_window(
             (0, 0), window=self.buttons_frame, anchor="nw", tags=("buttons_frame",)
         )
-        # Ensure the scrollregion is updated whenever the buttons frame changes size
+        # Ensure the scrollregion is updated whenever the buttons frame changes size.
+        # <Configure> fires once per layout change (e.g. for every button
+        # packed during start-up), so updates are coalesced into at most
+        # one per idle cycle.
+        self._scrollregion_pending = False
+
         def _update_sidebar_scrollregion(event=None):
-            self.sidebar_canvas.configure(scrollregion=self.sidebar_canvas.bbox("all"))
+            if self._scrollregion_pending:
+                return
+            self._scrollregion_pending = True
+
+            def _apply():
+                self._scrollregion_pending = False
+                self.sidebar_canvas.configure(scrollregion=self.sidebar_canvas.bbox("all"))
+            self.root.after_idle(_apply)
         self.buttons_frame.bind("<Configure>", _update_sidebar_scrollregion)
-        # Optionally, make the buttons frame width track the canvas width
+        # Optionally, make the buttons frame width track the canvas width,
+        # coalesced the same way while the window is being resized
+        self._sidebar_width_pending: Optional[int] = None
+
         def _resize_sidebar_frame(event):
-            self.sidebar_canvas.itemconfig("buttons_frame", width=event.width)
+            schedule = self._sidebar_width_pending is None
+            self._sidebar_width_pending = event.width
+            if not schedule:
+                return
+
+            def _apply():
+                width, self._sidebar_width_pending = self._sidebar_width_pending, None
+                self.sidebar_canvas.itemconfig("buttons_frame", width=width)
+            self.root.after_idle(_apply)
         self.sidebar_canvas.bind("<Configure>", _resize_sidebar_frame)
 
         # Enable mouse wheel scrolling within the sidebar.  Without this binding,
@@ -149,26 +1093,44 @@ class PDFToolkitApp:
         # platform-specific: Windows uses <MouseWheel> with delta values, while
         # Linux often uses Button-4/Button-5 for wheel events.  macOS also
         # supports <MouseWheel> with smaller delta values.
-        def _on_sidebar_mousewheel(event):
-            try:
-                delta = event.delta
-                # On Windows, delta is a multiple of 120; invert to get direction
-                if os.name == "nt":
-                    self.sidebar_canvas.yview_scroll(int(-1 * (delta / 120)), "units")
-                else:
-                    # On other platforms, delta may already be small; just use it
-                    if delta != 0:
-                        self.sidebar_canvas.yview_scroll(int(-1 * delta), "units")
-            except Exception:
-                pass
+        def _bind_mousewheel(area: tk.Widget, canvas: tk.Canvas) -> None:
+            """Scroll ``canvas`` with the wheel while the pointer is over ``area``."""
+            def _on_mousewheel(event):
+                try:
+                    delta = event.delta
+                    # On Windows, delta is a multiple of 120; invert to get direction
+                    if os.name == "nt":
+                        canvas.yview_scroll(int(-1 * (delta / 120)), "units")
+                    else:
+                        # On other platforms, delta may already be small; just use it
+                        if delta != 0:
+                            canvas.yview_scroll(int(-1 * delta), "units")
+                except Exception:
+                    pass
 
-        # Bind the wheel events globally on the root so that the scroll wheel
-        # always controls the sidebar when it is present.  This ensures
-        # compatibility with physical mouse wheels on all platforms.
-        self.root.bind_all("<MouseWheel>", _on_sidebar_mousewheel)
-        # Bind Linux-specific scroll events globally
-        self.root.bind_all("<Button-4>", lambda e: self.sidebar_canvas.yview_scroll(-1, "units"))
-        self.root.bind_all("<Button-5>", lambda e: self.sidebar_canvas.yview_scroll(1, "units"))
+            # Wheel events go to the widget under the pointer, which is
+            # usually a child button or the canvas itself, so the handlers
+            # are bound application-wide but only while the pointer is
+            # inside ``area``.
+            def _on_enter(event):
+                self.root.bind_all("<MouseWheel>", _on_mousewheel)
+                self.root.bind_all("<Button-4>", lambda e: canvas.yview_scroll(-1, "units"))
+                self.root.bind_all("<Button-5>", lambda e: canvas.yview_scroll(1, "units"))
+
+            def _on_leave(event):
+                # Moving onto a child widget also fires <Leave> on ``area``
+                under = self.root.winfo_containing(event.x_root, event.y_root)
+                if under is not None and (
+                    str(under) == str(area) or str(under).startswith(f"{area}.")
+                ):
+                    return
+                for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                    self.root.unbind_all(sequence)
+
+            area.bind("<Enter>", _on_enter)
+            area.bind("<Leave>", _on_leave)
+
+        _bind_mousewheel(self.sidebar, self.sidebar_canvas)
 
         # Create main content area for previews and status
         self.content = tk.Frame(root, bg=self.light_theme["content_bg"])
@@ -198,19 +1160,15 @@ class PDFToolkitApp:
             ("PDF to Text", self.pdf_to_text),
             ("About", self.show_about),
         ]
+        # The buttons share one ttk style, so a theme change reconfigures
+        # the style once instead of every button (see set_theme)
         for text, command in actions:
-            btn = tk.Button(
+            btn = ttk.Button(
                 self.buttons_frame,
                 text=text,
                 command=command,
-                font=("Segoe UI", 10, "bold"),
-                bg=self.light_theme["button_bg"],
-                fg=self.light_theme["button_fg"],
-                bd=0,
-                relief="flat",
+                style="Action.TButton",
                 cursor="hand2",
-                activebackground=self.light_theme["button_bg"],
-                activeforeground=self.light_theme["button_fg"],
             )
             btn.pack(fill="x", pady=5, padx=10)
             self.buttons.append(btn)
@@ -256,6 +1214,8 @@ class PDFToolkitApp:
         self.preview_hscrollbar.grid(row=1, column=0, sticky="ew")
         self.preview_container.rowconfigure(0, weight=1)
         self.preview_container.columnconfigure(0, weight=1)
+        # The preview scrolls with the wheel while the pointer is over it
+        _bind_mousewheel(self.preview_container, self.preview_canvas)
 
         # Create a bottom frame to hold the progress bar and clear-preview button
         # This positions the clear button next to the progress bar.
@@ -272,6 +1232,20 @@ class PDFToolkitApp:
             length=200,
         )
         self.progress.grid(row=0, column=0, sticky="ew", padx=(0, 10))
+        # Cancel button for long tasks that support it; set while such a
+        # task runs (see _run_bg) and checked by the worker
+        self.cancel_event = threading.Event()
+        self.cancel_btn = tk.Button(
+            self.bottom_frame,
+            text="Cancel",
+            command=self.cancel_task,
+            font=("Segoe UI", 10, "bold"),
+            bd=0,
+            relief="flat",
+            cursor="hand2",
+            state="disabled",
+        )
+        self.cancel_btn.grid(row=0, column=1, sticky="e", padx=(0, 10))
         # Clear preview button next to the progress bar
         self.clear_btn = tk.Button(
             self.bottom_frame,
@@ -282,14 +1256,24 @@ class PDFToolkitApp:
             relief="flat",
             cursor="hand2",
         )
-        self.clear_btn.grid(row=0, column=1, sticky="e")
+        self.clear_btn.grid(row=0, column=2, sticky="e")
         # Pack the bottom frame
         self.bottom_frame.pack(pady=5, padx=10, fill="x")
 
         # Enable drag-and-drop on Windows for quick file selection/preview
         self.setup_drag_and_drop()
 
+        # Base ttk theme for the custom button and progress bar styles; it
+        # only needs selecting once
+        self.style = ttk.Style()
+        try:
+            self.style.theme_use("clam")
+        except Exception:
+            # Fallback if clam is not available
+            self.style.theme_use("default")
+
         # Apply the initial theme settings
+        self._applied_theme: Optional[str] = None
         self.set_theme()
 
     # ------------------------------------------------------------------
@@ -306,21 +1290,33 @@ class PDFToolkitApp:
 
         This method selects the appropriate color palette based on
         ``self.is_dark_mode`` and updates the backgrounds, foregrounds,
-        button colours and progress bar style accordingly.  A custom
-        ttk.Style is configured for the progress bar to match the theme.
+        button colours and progress bar style accordingly.  Custom ttk
+        styles are configured for the action buttons and the progress bar
+        to match the theme.
         """
+        # Nothing to do if this palette is already applied
+        requested = "dark" if self.is_dark_mode else "light"
+        if self._applied_theme == requested:
+            return
+        self._applied_theme = requested
+
         # Choose theme palette
         theme = self.dark_theme if self.is_dark_mode else self.light_theme
 
         # Sidebar and content backgrounds
         self.sidebar.config(bg=theme["sidebar_bg"])
         # Update nested sidebar frames and canvas backgrounds
-        if hasattr(self, "top_sidebar_frame"):
-            self.top_sidebar_frame.config(bg=theme["sidebar_bg"])
-        if hasattr(self, "sidebar_canvas"):
-            self.sidebar_canvas.config(bg=theme["sidebar_bg"])
-        if hasattr(self, "buttons_frame"):
-            self.buttons_frame.config(bg=theme["sidebar_bg"])
+        self.top_sidebar_frame.config(bg=theme["sidebar_bg"])
+        for check in (self.refresh_cache_check, self.optimize_jpeg_check):
+            check.config(
+                bg=theme["sidebar_bg"],
+                fg=theme["label_fg"],
+                activebackground=theme["sidebar_bg"],
+                activeforeground=theme["label_fg"],
+                selectcolor=theme["content_bg"],
+            )
+        self.sidebar_canvas.config(bg=theme["sidebar_bg"])
+        self.buttons_frame.config(bg=theme["sidebar_bg"])
         self.content.config(bg=theme["content_bg"])
 
         # Header and status labels
@@ -330,43 +1326,40 @@ class PDFToolkitApp:
         # Preview canvas and container scrollbars
         self.preview_canvas.config(bg=theme["canvas_bg"])
         # Ensure container matches canvas background
-        if hasattr(self, "preview_container"):
-            self.preview_container.config(bg=theme["canvas_bg"])
+        self.preview_container.config(bg=theme["canvas_bg"])
 
-        # Buttons styling
-        for btn in self.buttons:
+        # Update the cancel and clear preview buttons and their container
+        for btn in (self.cancel_btn, self.clear_btn):
             btn.config(
                 bg=theme["button_bg"],
                 fg=theme["button_fg"],
                 activebackground=theme["button_bg"],
                 activeforeground=theme["button_fg"],
             )
-
-        # Update the clear preview button and its container if they exist
-        if hasattr(self, "clear_btn"):
-            self.clear_btn.config(
-                bg=theme["button_bg"],
-                fg=theme["button_fg"],
-                activebackground=theme["button_bg"],
-                activeforeground=theme["button_fg"],
-            )
-        if hasattr(self, "bottom_frame"):
-            self.bottom_frame.config(bg=theme["content_bg"])  # match content
+        self.bottom_frame.config(bg=theme["content_bg"])  # match content
 
         # Update the toggle button icon and background
         self.toggle_btn.config(
-            image=self.moon_image if self.is_dark_mode else self.sun_image,
+            image=self._icons["moon" if self.is_dark_mode else "sun"],
             bg=theme["sidebar_bg"],
         )
 
-        # Configure a custom style for the progress bar to reflect the theme
-        style = ttk.Style()
-        # Use the default theme as base to ensure our colors apply
-        try:
-            style.theme_use("clam")
-        except Exception:
-            # Fallback if clam is not available
-            style.theme_use("default")
+        # Configure the custom ttk styles to reflect the theme
+        style = self.style
+        # Sidebar action buttons all use this one style
+        style.configure(
+            "Action.TButton",
+            font=("Segoe UI", 10, "bold"),
+            background=theme["button_bg"],
+            foreground=theme["button_fg"],
+            borderwidth=0,
+            relief="flat",
+        )
+        style.map(
+            "Action.TButton",
+            background=[("active", theme["button_bg"])],
+            foreground=[("active", theme["button_fg"])],
+        )
         bar_style = "Modern.Horizontal.TProgressbar"
         style.configure(
             bar_style,
@@ -552,6 +1545,75 @@ class PDFToolkitApp:
             return None
         return filtered if multiple else [filtered[0]]
 
+    # ------------------------------------------------------------------
+    # Background tasks
+    # ------------------------------------------------------------------
+    def _ui(self, fn, *args, **kwargs) -> None:
+        """
+        Schedule ``fn(*args, **kwargs)`` on the Tk main loop.
+
+        Tk widgets must only be touched from the main thread, so worker
+        threads use this for every status update, dialog and preview.
+        """
+        self.root.after(0, lambda: fn(*args, **kwargs))
+
+    def _set_buttons_state(self, state: str) -> None:
+        """Enable or disable all sidebar action buttons."""
+        for btn in self.buttons:
+            btn.config(state=state)
+
+    def _run_bg(self, fn, *args, cancellable: bool = False) -> None:
+        """
+        Run ``fn(*args)`` on a daemon thread while the progress bar animates.
+
+        The sidebar buttons are disabled for the duration of the task so
+        only one operation runs at a time.  Any exception raised by ``fn``
+        is reported in an error dialog, so worker bodies do not need their
+        own catch-all handler.  For ``cancellable`` tasks the Cancel button
+        is enabled, and ``fn`` is expected to watch :attr:`cancel_event`.
+        """
+        self._set_buttons_state("disabled")
+        self.cancel_event.clear()
+        if cancellable:
+            self.cancel_btn.config(state="normal")
+        self.progress.start()
+
+        def worker() -> None:
+            try:
+                fn(*args)
+            except Exception as e:  # noqa: BLE001
+                self._ui(messagebox.showerror, "Error", str(e))
+            finally:
+                self._ui(self.progress.stop)
+                self._ui(self.progress.config, mode="indeterminate", value=0)
+                self._ui(self.cancel_btn.config, state="disabled")
+                self._ui(self._set_buttons_state, "normal")
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _set_progress(self, done: int, total: int) -> None:
+        """
+        Show ``done`` of ``total`` steps on the progress bar.
+
+        Called from worker threads of tasks that can count their steps; the
+        bar switches from its animation to determinate mode, and
+        :meth:`_run_bg` switches it back when the task ends.
+        """
+
+        def update() -> None:
+            if str(self.progress.cget("mode")) != "determinate":
+                self.progress.stop()
+                self.progress.config(mode="determinate", maximum=max(total, 1))
+            self.progress.config(value=done)
+
+        self._ui(update)
+
+    def cancel_task(self) -> None:
+        """Ask the running cancellable task to stop."""
+        self.cancel_event.set()
+        self.cancel_btn.config(state="disabled")
+        self.status_label.config(text="Cancelling...")
+
     # ------------------------------------------------------------------
     # Action handlers
     # ------------------------------------------------------------------
@@ -577,119 +1639,103 @@ class PDFToolkitApp:
         if not excel_path:
             return
         self.status_label.config(text=f"Selected: {os.path.basename(excel_path)}")
-        self.progress.start()
-        self.root.update()
-
-        try:
-            # Load all sheets in the workbook; sheet_name=None returns a dict
-            sheets_dict = pd.read_excel(excel_path, sheet_name=None)
-            # Determine maximum number of columns across all sheets
-            max_cols = max(len(df.columns) for df in sheets_dict.values())
-            # Use landscape if there are many columns (>5), else portrait
-            from reportlab.lib.pagesizes import letter, landscape
-            from reportlab.lib.units import inch
-            pagesize = landscape(letter) if max_cols > 5 else letter
-
-            # Prepare the PDF file path
-            pdf_path = os.path.splitext(excel_path)[0] + ".pdf"
-
-            from reportlab.platypus import (
-                SimpleDocTemplate,
-                Table,
-                TableStyle,
-                PageBreak,
-                Paragraph,
-                Spacer,
-            )
-            from reportlab.lib import colors
-            from reportlab.lib.styles import getSampleStyleSheet
-
-            # Build a story (list of flowables) containing a table per sheet
-            story: List = []
-            styles = getSampleStyleSheet()
-            for sheet_name, df in sheets_dict.items():
-                # Ensure all values are strings to avoid issues with floats/NaNs
-                df_str = df.fillna("").astype(str)
-                # Compute maximum length (in characters) for each column,
-                # including the header.  Use a minimum of 1 to avoid zero width.
-                max_lengths = []
-                for col in df_str.columns:
-                    max_len = max(
-                        [len(str(col))] + [len(s) for s in df_str[col].tolist()]
-                    )
-                    max_lengths.append(max(max_len, 1))
-
-                total_length = sum(max_lengths)
-                # Available page width excluding margins (0.5 inch each side)
-                page_width = pagesize[0] - 2 * 0.5 * inch
-                # Compute individual column widths proportional to content length
-                col_widths = [
-                    (length / total_length) * page_width for length in max_lengths
+        self._run_bg(self._excel_to_pdf_impl, excel_path)
+
+    def _excel_to_pdf_impl(self, excel_path: str) -> None:
+        """Worker body for :meth:`excel_to_pdf`; runs off the Tk thread."""
+        # Load all sheets in the workbook as rows of strings
+        sheets = _read_sheets(excel_path)
+        # If there is nothing to convert, bail out
+        if not sheets:
+            raise ValueError("No sheets to convert.")
+        # Determine maximum number of columns across all sheets
+        max_cols = max(len(max_lengths) for _, _, max_lengths in sheets)
+        # Use landscape if there are many columns (>5), else portrait
+        from reportlab.lib.pagesizes import letter, landscape
+        from reportlab.lib.units import inch
+        pagesize = landscape(letter) if max_cols > 5 else letter
+
+        # Prepare the PDF file path
+        pdf_path = os.path.splitext(excel_path)[0] + ".pdf"
+
+        from reportlab.platypus import (
+            SimpleDocTemplate,
+            Table,
+            TableStyle,
+            PageBreak,
+            Paragraph,
+            Spacer,
+        )
+        from reportlab.lib import colors
+        from reportlab.lib.styles import getSampleStyleSheet
+
+        # Build a story (list of flowables) containing a table per sheet
+        story: List = []
+        styles = getSampleStyleSheet()
+        for sheet_name, table_data, max_lengths in sheets:
+            total_length = sum(max_lengths)
+            # Available page width excluding margins (0.5 inch each side)
+            page_width = pagesize[0] - 2 * 0.5 * inch
+            # Compute individual column widths proportional to content length
+            col_widths = [
+                (length / total_length) * page_width for length in max_lengths
+            ]
+
+            # table_data holds the header row followed by data rows
+            table = Table(table_data, colWidths=col_widths, repeatRows=1)
+
+            # Apply a simple style: alternating row backgrounds and grid lines
+            style = TableStyle(
+                [
+                    ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                    ("FONTSIZE", (0, 0), (-1, 0), 9),
+                    ("BOTTOMPADDING", (0, 0), (-1, 0), 6),
+                    # Explicit body font so every cell shares one setting
+                    ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+                    ("FONTSIZE", (0, 1), (-1, -1), 8),
+                    # Alternate row background with a single command
+                    # instead of one BACKGROUND command per even row
+                    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.whitesmoke, colors.lightgrey]),
+                    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
                 ]
-
-                # Construct table data with header row followed by data rows
-                table_data = [list(df_str.columns)] + df_str.values.tolist()
-                table = Table(table_data, colWidths=col_widths, repeatRows=1)
-
-                # Apply a simple style: alternating row backgrounds and grid lines
-                style = TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                        ("FONTSIZE", (0, 0), (-1, 0), 9),
-                        ("BOTTOMPADDING", (0, 0), (-1, 0), 6),
-                        ("BACKGROUND", (0, 1), (-1, -1), colors.whitesmoke),
-                        ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-                    ]
-                )
-                # Alternate row background
-                for row_num in range(1, len(table_data)):
-                    if row_num % 2 == 0:
-                        style.add("BACKGROUND", (0, row_num), (-1, row_num), colors.lightgrey)
-                table.setStyle(style)
-
-                # Add sheet name as a simple header above the table
-                header = Paragraph(f"<b>{sheet_name}</b>", styles["Heading2"])
-                story.append(header)
-                story.append(Spacer(1, 0.2 * inch))
-                story.append(table)
-                story.append(PageBreak())
-
-            # If story is empty, bail out
-            if not story:
-                raise ValueError("No sheets to convert.")
-
-            # Build the PDF
-            doc = SimpleDocTemplate(
-                pdf_path,
-                pagesize=pagesize,
-                leftMargin=0.5 * inch,
-                rightMargin=0.5 * inch,
-                topMargin=0.5 * inch,
-                bottomMargin=0.5 * inch,
             )
-            # Remove the final PageBreak so there isn't a blank page at the end
-            from reportlab.platypus import PageBreak
-            if isinstance(story[-1], PageBreak):
-                story.pop()
-            doc.build(story)
-
-            # Update status and preview
-            self.status_label.config(text=f"Saved as: {os.path.basename(pdf_path)}")
-            self.preview_pdf_page(pdf_path)
-        except Exception as e:  # noqa: BLE001
-            messagebox.showerror("Error", str(e))
-        finally:
-            self.progress.stop()
+            table.setStyle(style)
+
+            # Add sheet name as a simple header above the table
+            header = Paragraph(f"<b>{sheet_name}</b>", styles["Heading2"])
+            story.append(header)
+            story.append(Spacer(1, 0.2 * inch))
+            story.append(table)
+            story.append(PageBreak())
+
+        # Build the PDF
+        doc = SimpleDocTemplate(
+            pdf_path,
+            pagesize=pagesize,
+            leftMargin=0.5 * inch,
+            rightMargin=0.5 * inch,
+            topMargin=0.5 * inch,
+            bottomMargin=0.5 * inch,
+        )
+        # Remove the final PageBreak so there isn't a blank page at the end
+        from reportlab.platypus import PageBreak
+        if isinstance(story[-1], PageBreak):
+            story.pop()
+        doc.build(story)
+
+        # Update status and preview
+        self._ui(self.status_label.config, text=f"Saved as: {os.path.basename(pdf_path)}")
+        self._ui(self.preview_pdf_page, pdf_path)
 
     def pdf_to_text(self) -> None:
         """
         Extract all text from a PDF and save it to a plain-text file.
 
         This method prompts the user to select a PDF file and then uses
-        pdfplumber to read each page's text content.  The extracted text
+        PyMuPDF to read each page's text content.  The extracted text
         (with page breaks preserved) is written to a `.txt` file next to
         the original PDF, suffixed with `_extracted.txt`.  If the user
         cancels the file selection or the PDF has no extractable text,
@@ -704,39 +1750,111 @@ class PDFToolkitApp:
         if not pdf_path:
             return
         self.status_label.config(text=f"Selected: {os.path.basename(pdf_path)}")
-        self.progress.start()
-        self.root.update()
-        try:
-            output_path = os.path.splitext(pdf_path)[0] + "_extracted.txt"
-            extracted_text: List[str] = []
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    try:
-                        text = page.extract_text() or ""
-                        extracted_text.append(text)
-                    except Exception:
-                        continue
-            if not any(extracted_text):
-                messagebox.showwarning(
-                    "No Text",
-                    "No extractable text found in this PDF.",
-                )
+        self._run_bg(self._pdf_to_text_impl, pdf_path, self.refresh_cache.get())
+
+    def _pdf_to_text_impl(self, pdf_path: str, refresh: bool = False) -> None:
+        """Worker body for :meth:`pdf_to_text`; runs off the Tk thread."""
+        output_path = os.path.splitext(pdf_path)[0] + "_extracted.txt"
+        # Re-opening a PDF that was already extracted copies the earlier
+        # result instead of extracting again.  Entries are keyed like the
+        # previews, so a miss costs no extra read of the PDF.  The contents
+        # are only hashed once the key hits: the first hit records the
+        # digest and later hits check it, so a file rewritten with the same
+        # size and mtime is extracted again rather than served stale text.
+        stat = os.stat(pdf_path)
+        key = hashlib.blake2b(
+            f"{os.path.abspath(pdf_path)}|{stat.st_mtime_ns}|{stat.st_size}".encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+        cache_path = os.path.join(TEXT_CACHE_DIR, key + ".txt")
+        digest_path = os.path.join(TEXT_CACHE_DIR, key + ".digest")
+        if not refresh and os.path.isfile(cache_path):
+            try:
+                digest = _file_digest(pdf_path)
+                try:
+                    with open(digest_path, "r", encoding="ascii") as f:
+                        recorded = f.read()
+                except FileNotFoundError:
+                    recorded = digest
+                    with open(digest_path, "w", encoding="ascii") as f:
+                        f.write(digest)
+                if recorded == digest:
+                    shutil.copyfile(cache_path, output_path)
+                    os.utime(cache_path)
+                    self._show_extracted_text(output_path)
+                    return
+            except OSError:
+                pass
+
+        # MuPDF extracts text in C, which is far faster than pdfplumber's
+        # pure-Python layout analysis on large documents.  Pages are
+        # independent, so big documents are split across worker processes;
+        # small ones are not worth the pool start-up cost.
+        MIN_PAGES_FOR_PARALLEL = 20
+        workers = min(os.cpu_count() or 1, 4)
+        with fitz.open(pdf_path) as doc:
+            page_count = doc.page_count
+
+        def page_texts():
+            if workers > 1 and page_count > MIN_PAGES_FOR_PARALLEL:
+                # Several small chunks per worker keep the amount of text
+                # held in memory at once well below the whole document
+                chunks = _page_chunks(0, page_count, workers * 4)
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    for texts in executor.map(
+                        _extract_text_range,
+                        repeat(pdf_path),
+                        [start for start, _ in chunks],
+                        [stop for _, stop in chunks],
+                    ):
+                        yield from texts
             else:
-                full_text = "\f".join(extracted_text)
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(full_text)
-                self.status_label.config(
-                    text=f"Saved as: {os.path.basename(output_path)}"
-                )
-                preview = full_text[:500]
-                messagebox.showinfo(
-                    "Success",
-                    f"Extracted text saved to {output_path}.\n\nPreview:\n\n{preview}",
-                )
-        except Exception as e:  # noqa: BLE001
-            messagebox.showerror("Error", str(e))
-        finally:
-            self.progress.stop()
+                yield from _iter_text_range(pdf_path, 0, page_count)
+
+        # Stream pages straight to disk, separated by form feeds, rather
+        # than joining the whole document in memory first.  A 1 MiB buffer
+        # turns many small page writes into a few large ones.
+        has_text = False
+        with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            for i, text in enumerate(page_texts()):
+                if i:
+                    f.write("\f")
+                f.write(text)
+                has_text = has_text or bool(text)
+        if not has_text:
+            os.remove(output_path)
+            self._ui(
+                messagebox.showwarning,
+                "No Text",
+                "No extractable text found in this PDF.",
+            )
+            return
+        try:
+            os.makedirs(TEXT_CACHE_DIR, exist_ok=True)
+            tmp_path = cache_path + ".tmp"
+            shutil.copyfile(output_path, tmp_path)
+            os.replace(tmp_path, cache_path)
+            # A digest left from an older entry under this key is stale
+            if os.path.exists(digest_path):
+                os.remove(digest_path)
+            _prune_cache(TEXT_CACHE_DIR, TEXT_CACHE_MAX_BYTES)
+        except OSError:
+            pass  # the cache is only an optimisation
+        self._show_extracted_text(output_path)
+
+    def _show_extracted_text(self, output_path: str) -> None:
+        """Report a saved pdf_to_text result with a short preview."""
+        self._ui(
+            self.status_label.config,
+            text=f"Saved as: {os.path.basename(output_path)}",
+        )
+        with open(output_path, "r", encoding="utf-8") as f:
+            preview = f.read(500)
+        self._ui(
+            messagebox.showinfo,
+            "Success",
+            f"Extracted text saved to {output_path}.\n\nPreview:\n\n{preview}",
+        )
 
     def clear_preview(self) -> None:
         """
@@ -772,108 +1890,118 @@ class PDFToolkitApp:
             return
 
         self.status_label.config(text=f"Selected: {os.path.basename(pdf_path)}")
-        self.progress.start()
-        self.root.update()
 
-        try:
-            output_path = os.path.splitext(pdf_path)[0] + "_tables.xlsx"
-            all_tables: List[pd.DataFrame] = []
+        # Determine page count to handle large PDFs
+        total_pages = _pdf_page_count(pdf_path)
 
-            # Determine page count to handle large PDFs
-            try:
-                doc = fitz.open(pdf_path)
-                total_pages = doc.page_count
-            except Exception:
-                total_pages = None
-            finally:
-                try:
-                    doc.close()
-                except Exception:
-                    pass
-
-            start_page = 1
-            end_page = None
-            MAX_PAGES_FOR_FULL_EXTRACTION = 100
-            if total_pages is not None and total_pages > MAX_PAGES_FOR_FULL_EXTRACTION:
-                # Prompt user for page range when the document is large
-                msg = (
-                    f"This PDF has {total_pages} pages. Extracting tables from all pages "
-                    "may take a long time.\n"
-                    "Enter the starting and ending pages for extraction."
-                )
-                first_page_in = simpledialog.askinteger(
-                    "Start Page",
-                    msg + "\n\nStart page:",
-                    minvalue=1,
-                    maxvalue=total_pages,
-                )
-                if first_page_in is None:
-                    return
-                last_page_in = simpledialog.askinteger(
-                    "End Page",
-                    f"End page (between {first_page_in} and {total_pages}):",
-                    minvalue=first_page_in,
-                    maxvalue=total_pages,
-                )
-                if last_page_in is None:
-                    return
-                start_page = first_page_in
-                end_page = last_page_in
-            elif total_pages is not None:
-                end_page = total_pages
-
-            with pdfplumber.open(pdf_path) as pdf:
-                # Build range of page indices to iterate (0-based)
-                if end_page is None:
-                    page_indices = range(len(pdf.pages))
-                else:
-                    page_indices = range(start_page - 1, end_page)
-                for idx in page_indices:
-                    try:
-                        page = pdf.pages[idx]
-                    except IndexError:
-                        break
-                    # Attempt to extract tables using line detection
-                    tables = page.extract_tables(
-                        {
-                            "vertical_strategy": "lines",
-                            "horizontal_strategy": "lines",
-                            "intersection_tolerance": 5,
-                            "snap_tolerance": 3,
-                            "join_tolerance": 3,
-                            "edge_min_length": 3,
-                        }
-                    )
-                    for table in tables:
-                        if table:
-                            df = pd.DataFrame(table)
-                            all_tables.append(df)
-
-            if all_tables:
-                with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-                    for i, df in enumerate(all_tables):
-                        # Write each table to a separate sheet; no header is assumed
-                        df.to_excel(
-                            writer,
-                            sheet_name=f"Table_{i + 1}",
-                            index=False,
-                            header=False,
-                        )
-                self.status_label.config(
-                    text=f"Saved as: {os.path.basename(output_path)}"
-                )
-                messagebox.showinfo(
-                    "Success", f"Excel saved as {output_path}"
-                )
+        start_page = 1
+        end_page = None
+        MAX_PAGES_FOR_FULL_EXTRACTION = 100
+        if total_pages is not None and total_pages > MAX_PAGES_FOR_FULL_EXTRACTION:
+            # Prompt user for page range when the document is large
+            msg = (
+                f"This PDF has {total_pages} pages. Extracting tables from all pages "
+                "may take a long time.\n"
+                "Enter the starting and ending pages for extraction."
+            )
+            first_page_in = simpledialog.askinteger(
+                "Start Page",
+                msg + "\n\nStart page:",
+                minvalue=1,
+                maxvalue=total_pages,
+            )
+            if first_page_in is None:
+                return
+            last_page_in = simpledialog.askinteger(
+                "End Page",
+                f"End page (between {first_page_in} and {total_pages}):",
+                minvalue=first_page_in,
+                maxvalue=total_pages,
+            )
+            if last_page_in is None:
+                return
+            start_page = first_page_in
+            end_page = last_page_in
+        elif total_pages is not None:
+            end_page = total_pages
+
+        self._run_bg(self._pdf_to_excel_impl, pdf_path, start_page, end_page)
+
+    def _pdf_to_excel_impl(
+        self, pdf_path: str, start_page: int, end_page: Optional[int]
+    ) -> None:
+        """Worker body for :meth:`pdf_to_excel`; runs off the Tk thread."""
+        import pandas as pd
+
+        output_path = os.path.splitext(pdf_path)[0] + "_tables.xlsx"
+
+        # Table detection is the slowest step, so large page ranges are
+        # split across worker processes.  Each worker returns its tables in
+        # page order, which keeps the sheet numbering stable.
+        MIN_PAGES_FOR_PARALLEL = 10
+        workers = min(os.cpu_count() or 1, 4)
+        start_idx = start_page - 1
+
+        def page_tables():
+            if (
+                end_page is not None
+                and workers > 1
+                and end_page - start_idx > MIN_PAGES_FOR_PARALLEL
+            ):
+                # Several small chunks per worker keep the number of
+                # tables held in memory at once well below the whole range.
+                # Workers detect tables in the chunks ahead while this
+                # thread writes the finished ones to the workbook; the
+                # window stops them running far ahead of the writer.
+                chunks = _page_chunks(start_idx, end_page, workers * 4)
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    for tables in _bounded_map(
+                        executor,
+                        _extract_tables_range,
+                        repeat(pdf_path),
+                        [start for start, _ in chunks],
+                        [stop for _, stop in chunks],
+                        window=2 * workers,
+                    ):
+                        yield from tables
             else:
-                messagebox.showinfo(
-                    "No Data",
-                    "No tables could be extracted from this PDF."
+                yield from _iter_tables_range(pdf_path, start_idx, end_page)
+
+        # Write each table as soon as it arrives instead of collecting
+        # DataFrames first.  The workbook is only created once there is a
+        # table, since openpyxl cannot save a workbook without sheets.
+        writer = None
+        table_count = 0
+        try:
+            for table in page_tables():
+                if writer is None:
+                    writer = pd.ExcelWriter(output_path, engine="openpyxl")
+                table_count += 1
+                # Write each table to a separate sheet; no header is assumed
+                pd.DataFrame(table).to_excel(
+                    writer,
+                    sheet_name=f"Table_{table_count}",
+                    index=False,
+                    header=False,
                 )
-        except Exception as e:  # noqa: BLE001
-            messagebox.showerror("Error", str(e))
         finally:
-            self.progress.stop()
+            if writer is not None:
+                writer.close()
+
+        if table_count:
+            self._ui(
+                self.status_label.config,
+                text=f"Saved as: {os.path.basename(output_path)}",
+            )
+            self._ui(
+                messagebox.showinfo, "Success", f"Excel saved as {output_path}"
+            )
+        else:
+            self._ui(
+                messagebox.showinfo,
+                "No Data",
+                "No tables could be extracted from this PDF."
+            )
 
     def pdf_to_word(self) -> None:
         """
@@ -889,63 +2017,135 @@ class PDFToolkitApp:
             return
 
         self.status_label.config(text=f"Selected: {os.path.basename(pdf_path)}")
-        self.progress.start()
-        self.root.update()
-        try:
-            docx_path = os.path.splitext(pdf_path)[0] + ".docx"
-            # Determine page count to handle very large PDFs
-            try:
-                doc = fitz.open(pdf_path)
-                total_pages = doc.page_count
-            except Exception:
-                total_pages = None
-            finally:
-                try:
-                    doc.close()
-                except Exception:
-                    pass
+        # Determine page count to handle very large PDFs
+        total_pages = _pdf_page_count(pdf_path)
+
+        start_idx = 0  # zero-based index for start page
+        end_idx = None  # zero-based index for end page (inclusive)
+        MAX_PAGES_FOR_FULL_CONVERT = 100
+        if total_pages is not None and total_pages > MAX_PAGES_FOR_FULL_CONVERT:
+            # Ask the user for a page range to convert
+            msg = (
+                f"This PDF has {total_pages} pages. Converting all pages to DOCX "
+                "may take a long time.\n"
+                "Enter the starting and ending pages to convert."
+            )
+            first_page_in = simpledialog.askinteger(
+                "Start Page",
+                msg + "\n\nStart page:",
+                minvalue=1,
+                maxvalue=total_pages,
+            )
+            if first_page_in is None:
+                return
+            last_page_in = simpledialog.askinteger(
+                "End Page",
+                f"End page (between {first_page_in} and {total_pages}):",
+                minvalue=first_page_in,
+                maxvalue=total_pages,
+            )
+            if last_page_in is None:
+                return
+            start_idx = first_page_in - 1
+            end_idx = last_page_in - 1
+        self._run_bg(
+            self._pdf_to_word_impl,
+            pdf_path,
+            start_idx,
+            end_idx,
+            total_pages,
+            cancellable=True,
+        )
 
-            start_idx = 0  # zero-based index for start page
-            end_idx = None  # zero-based index for end page (inclusive)
-            MAX_PAGES_FOR_FULL_CONVERT = 100
-            if total_pages is not None and total_pages > MAX_PAGES_FOR_FULL_CONVERT:
-                # Ask the user for a page range to convert
-                msg = (
-                    f"This PDF has {total_pages} pages. Converting all pages to DOCX "
-                    "may take a long time.\n"
-                    "Enter the starting and ending pages to convert."
-                )
-                first_page_in = simpledialog.askinteger(
-                    "Start Page",
-                    msg + "\n\nStart page:",
-                    minvalue=1,
-                    maxvalue=total_pages,
-                )
-                if first_page_in is None:
+    def _pdf_to_word_impl(
+        self,
+        pdf_path: str,
+        start_idx: int,
+        end_idx: Optional[int],
+        total_pages: Optional[int] = None,
+    ) -> None:
+        """Worker body for :meth:`pdf_to_word`; runs off the Tk thread."""
+        docx_path = os.path.splitext(pdf_path)[0] + ".docx"
+        # The page count was read before the range prompt; only count here
+        # if that failed, so the file is not opened again for nothing
+        page_count = total_pages
+        if page_count is None:
+            with fitz.open(pdf_path) as doc:
+                page_count = doc.page_count
+        # end_idx is the inclusive last page; pdf2docx wants an exclusive end
+        stop = page_count if end_idx is None else min(end_idx + 1, page_count)
+
+        # pdf2docx converts on a single core, so long ranges are split into
+        # one part per worker process and the parts are joined afterwards
+        # with docxcompose (when it is installed)
+        MIN_PAGES_FOR_PARALLEL = 20
+        workers = min(os.cpu_count() or 1, 4)
+        composer = _optional_import("docxcompose.composer")
+        if composer is not None and workers > 1 and stop - start_idx > MIN_PAGES_FOR_PARALLEL:
+            from docx import Document
+
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                ranges = _page_chunks(start_idx, stop, workers)
+                parts = [os.path.join(tmp_dir, f"part_{i}.docx") for i in range(len(ranges))]
+                if not self._convert_docx_parts(pdf_path, ranges, parts):
+                    self._ui(self.status_label.config, text="PDF to Word cancelled")
                     return
-                last_page_in = simpledialog.askinteger(
-                    "End Page",
-                    f"End page (between {first_page_in} and {total_pages}):",
-                    minvalue=first_page_in,
-                    maxvalue=total_pages,
-                )
-                if last_page_in is None:
-                    return
-                start_idx = first_page_in - 1
-                end_idx = last_page_in - 1
-            # Convert specified page range (or all pages if end_idx is None)
-            cv = Converter(pdf_path)
-            if end_idx is None:
-                cv.convert(docx_path, start=start_idx)
-            else:
-                cv.convert(docx_path, start=start_idx, end=end_idx)
-            cv.close()
-            self.status_label.config(text=f"Saved as: {os.path.basename(docx_path)}")
-            messagebox.showinfo("Success", f"Word document saved as {docx_path}")
-        except Exception as e:  # noqa: BLE001
-            messagebox.showerror("Error", str(e))
+                merged = composer.Composer(Document(parts[0]))
+                for part in parts[1:]:
+                    merged.append(Document(part))
+                merged.save(docx_path)
+        elif not self._convert_docx_parts(pdf_path, [(start_idx, stop)], [docx_path]):
+            # Don't leave a half-written document behind
+            try:
+                os.remove(docx_path)
+            except OSError:
+                pass
+            self._ui(self.status_label.config, text="PDF to Word cancelled")
+            return
+        self._ui(self.status_label.config, text=f"Saved as: {os.path.basename(docx_path)}")
+        self._ui(messagebox.showinfo, "Success", f"Word document saved as {docx_path}")
+
+    def _convert_docx_parts(
+        self, pdf_path: str, ranges: List[Tuple[int, int]], paths: List[str]
+    ) -> bool:
+        """
+        Convert each page range of ``pdf_path`` to the matching ``.docx``
+        path, one child process per range.
+
+        pdf2docx offers no way to interrupt a conversion, so running it in
+        child processes lets the Cancel button terminate them.  Returns
+        False if the task was cancelled; raises RuntimeError with the
+        first conversion error.
+        """
+        jobs = []
+        for (start, stop), path in zip(ranges, paths):
+            result_conn, child_conn = Pipe(duplex=False)
+            proc = Process(
+                target=_convert_pdf_to_docx,
+                args=(pdf_path, path, start, stop, child_conn),
+                daemon=True,
+            )
+            proc.start()
+            child_conn.close()
+            jobs.append((proc, result_conn))
+        try:
+            while any(proc.is_alive() for proc, _ in jobs):
+                if self.cancel_event.wait(0.2):
+                    return False
+            for proc, result_conn in jobs:
+                proc.join()
+                if result_conn.poll():
+                    error = result_conn.recv()
+                else:
+                    error = f"The conversion process exited with code {proc.exitcode}."
+                if error:
+                    raise RuntimeError(error)
+            return True
         finally:
-            self.progress.stop()
+            for proc, _ in jobs:
+                if proc.is_alive():
+                    proc.terminate()
+                proc.join()
 
     def word_to_pdf(self) -> None:
         """
@@ -962,18 +2162,28 @@ class PDFToolkitApp:
             return
 
         self.status_label.config(text=f"Selected: {os.path.basename(doc_path)}")
-        self.progress.start()
-        self.root.update()
+        self._run_bg(self._word_to_pdf_impl, doc_path)
+
+    def _word_to_pdf_impl(self, doc_path: str) -> None:
+        """Worker body for :meth:`word_to_pdf`; runs off the Tk thread."""
+        # Word->PDF may use docx2pdf if available, else COM automation
+        docx2pdf = _optional_import("docx2pdf")
+        win32com_client = _optional_import("win32com.client")
+        pythoncom = _optional_import("pythoncom")
+        # Both docx2pdf and the COM fallback drive Word through COM, which
+        # must be initialised on every thread that uses it.
+        if pythoncom is not None:
+            pythoncom.CoInitialize()
         try:
             pdf_path = os.path.splitext(doc_path)[0] + ".pdf"
             # Prefer docx2pdf if available
-            if docx2pdf_convert is not None:
+            if docx2pdf is not None:
                 try:
-                    docx2pdf_convert(doc_path, pdf_path)
+                    docx2pdf.convert(doc_path, pdf_path)
                 except Exception:
                     # fallback to COM
-                    if win32com:
-                        word = win32com.client.Dispatch("Word.Application")  # type: ignore
+                    if win32com_client is not None:
+                        word = win32com_client.Dispatch("Word.Application")  # type: ignore
                         word.Visible = False
                         doc = word.Documents.Open(doc_path)  # type: ignore
                         # 17 = wdFormatPDF
@@ -984,8 +2194,8 @@ class PDFToolkitApp:
                         raise
             else:
                 # Use COM if docx2pdf is not available
-                if win32com:
-                    word = win32com.client.Dispatch("Word.Application")  # type: ignore
+                if win32com_client is not None:
+                    word = win32com_client.Dispatch("Word.Application")  # type: ignore
                     word.Visible = False
                     doc = word.Documents.Open(doc_path)  # type: ignore
                     doc.SaveAs(pdf_path, FileFormat=17)  # type: ignore
@@ -993,13 +2203,12 @@ class PDFToolkitApp:
                     word.Quit()
                 else:
                     raise RuntimeError("Neither docx2pdf nor win32com are available.")
-            self.status_label.config(text=f"Saved as: {os.path.basename(pdf_path)}")
-            self.preview_pdf_page(pdf_path)
-            messagebox.showinfo("Success", f"PDF saved as:\n{pdf_path}")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
         finally:
-            self.progress.stop()
+            if pythoncom is not None:
+                pythoncom.CoUninitialize()
+        self._ui(self.status_label.config, text=f"Saved as: {os.path.basename(pdf_path)}")
+        self._ui(self.preview_pdf_page, pdf_path)
+        self._ui(messagebox.showinfo, "Success", f"PDF saved as:\n{pdf_path}")
 
     def compress_pdf(self) -> None:
         """
@@ -1044,66 +2253,31 @@ class PDFToolkitApp:
             dpi = 150
 
         self.status_label.config(text=f"Selected: {os.path.basename(pdf_path)}")
-        self.progress.start()
-        self.root.update()
-        try:
-            input_size = os.path.getsize(pdf_path)
-            output_path = os.path.splitext(pdf_path)[0] + "_compressed.pdf"
-            # First attempt: lossless compression using garbage collection and deflate
-            doc = fitz.open(pdf_path)
-            try:
-                doc.save(output_path, garbage=4, deflate=True)
-            finally:
-                doc.close()
-            out_size = os.path.getsize(output_path)
-
-            # Determine page count to decide whether to attempt lossy fallback
-            try:
-                doc_info = fitz.open(pdf_path)
-                page_count = doc_info.page_count
-            except Exception:
-                page_count = None
-            finally:
-                try:
-                    doc_info.close()
-                except Exception:
-                    pass
-
-            # Threshold to avoid processing extremely large PDFs in the lossy fallback
-            MAX_PAGES_FOR_LOSSY = 500
-            # If the file wasn't reduced or the user specifically requested stronger compression
-            # and the PDF isn't too large, perform lossy downsampling; otherwise skip.
-            if out_size >= input_size and (page_count is None or page_count <= MAX_PAGES_FOR_LOSSY):
-                import io
-                from PIL import Image
-                doc = fitz.open(pdf_path)
-                for page in doc:
-                    # Compute zoom factor based on DPI
-                    zoom = dpi / 72.0
-                    mat = fitz.Matrix(zoom, zoom)
-                    pix = page.get_pixmap(matrix=mat)  # type: ignore[attr-defined]
-                    # Convert to PIL image and compress as JPEG
-                    img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
-                    buf = io.BytesIO()
-                    img.save(buf, format="JPEG", quality=quality)
-                    page.clean_contents()
-                    page.insert_image(page.rect, stream=buf.getvalue())  # type: ignore[attr-defined]
-                doc.save(output_path)
-                doc.close()
-            elif out_size >= input_size:
-                # Skip lossy fallback for very large PDFs
-                messagebox.showinfo(
-                    "Skipped Fallback",
-                    f"The PDF has {page_count} pages. Lossy compression was skipped to avoid memory issues."
-                )
-            self.status_label.config(
-                text=f"Saved as: {os.path.basename(output_path)}"
+        self._run_bg(self._compress_pdf_impl, pdf_path, quality, dpi)
+
+    def _compress_pdf_impl(self, pdf_path: str, quality: int, dpi: int) -> None:
+        """Worker body for :meth:`compress_pdf`; runs off the Tk thread."""
+        # Threshold to avoid processing extremely large PDFs in the lossy fallback
+        MAX_PAGES_FOR_LOSSY = 500
+        _, _, output_path, skipped = _compress_one(
+            pdf_path,
+            quality=quality,
+            dpi=dpi,
+            max_lossy_pages=MAX_PAGES_FOR_LOSSY,
+            workers=max(1, (os.cpu_count() or 1) - 1),
+        )
+        if skipped:
+            # Skip lossy fallback for very large PDFs
+            self._ui(
+                messagebox.showinfo,
+                "Skipped Fallback",
+                f"The PDF has more than {MAX_PAGES_FOR_LOSSY} pages. Lossy compression was skipped to avoid memory issues."
             )
-            self.preview_pdf_page(output_path)
-        except Exception as e:  # noqa: BLE001
-            messagebox.showerror("Error", str(e))
-        finally:
-            self.progress.stop()
+        self._ui(
+            self.status_label.config,
+            text=f"Saved as: {os.path.basename(output_path)}",
+        )
+        self._ui(self.preview_pdf_page, output_path)
 
     def image_to_pdf(self) -> None:
         """
@@ -1139,56 +2313,42 @@ class PDFToolkitApp:
             return
 
         self.status_label.config(text=f"Selected {len(img_paths)} image(s)")
-        self.progress.start()
-        self.root.update()
-        try:
-            pdf_path = filedialog.asksaveasfilename(
-                defaultextension=".pdf", filetypes=[("PDF File", "*.pdf")]
-            )
-            if not pdf_path:
-                return
-            import io
-            images_data: List[io.BytesIO] = []
-            for path in img_paths:
-                try:
-                    img = Image.open(path)
-                    # Convert to RGB if necessary
-                    if img.mode not in ("RGB", "L"):
-                        img = img.convert("RGB")
-                    # Compress image to JPEG
-                    buf = io.BytesIO()
-                    img.save(buf, format="JPEG", quality=85)
-                    buf.seek(0)
-                    images_data.append(buf)
-                except Exception:
-                    # Skip unreadable images
-                    continue
-            if not images_data:
-                messagebox.showwarning("No Images", "No valid images selected.")
-                return
-            # Write the compressed images into a single PDF
-            merged_bytes = img2pdf.convert(images_data)
-            with open(pdf_path, "wb") as f:
-                f.write(merged_bytes)
-            self.status_label.config(
-                text=f"Saved as: {os.path.basename(pdf_path)}"
+        pdf_path = filedialog.asksaveasfilename(
+            defaultextension=".pdf", filetypes=[("PDF File", "*.pdf")]
+        )
+        if not pdf_path:
+            return
+        self._run_bg(self._image_to_pdf_impl, list(img_paths), pdf_path)
+
+    def _image_to_pdf_impl(self, img_paths: List[str], pdf_path: str) -> None:
+        """Worker body for :meth:`image_to_pdf`; runs off the Tk thread."""
+        import img2pdf
+        images_data = _images_for_pdf(img_paths)
+        if not images_data:
+            self._ui(messagebox.showwarning, "No Images", "No valid images selected.")
+            return
+        # Write the compressed images into a single PDF
+        with open(pdf_path, "wb") as f:
+            img2pdf.convert(
+                images_data, outputstream=f, rotation=img2pdf.Rotation.ifvalid
             )
-            self.preview_pdf_page(pdf_path)
-        except Exception as e:  # noqa: BLE001
-            messagebox.showerror("Error", str(e))
-        finally:
-            self.progress.stop()
+        self._ui(
+            self.status_label.config,
+            text=f"Saved as: {os.path.basename(pdf_path)}",
+        )
+        self._ui(self.preview_pdf_page, pdf_path)
 
     def preview_image_file(self, img_path: str) -> None:
         """
-        Preview an image file in the main canvas, scaling to fit.
+        Preview an image file in the main canvas, shrinking it to fit.
 
-        The image is resized to the current canvas dimensions while
+        Images larger than the canvas are scaled down to fit it while
         preserving aspect ratio, and the Tk reference is kept alive
-        on the instance to avoid garbage collection.
+        on the instance to avoid garbage collection.  The last few
+        previews are kept in memory, so showing an unchanged file again
+        at the same canvas size does not decode it again.
         """
         try:
-            img_prev = Image.open(img_path)
             self.root.update_idletasks()
             canvas_width = self.preview_canvas.winfo_width()
             canvas_height = self.preview_canvas.winfo_height()
@@ -1196,15 +2356,29 @@ class PDFToolkitApp:
                 max_width, max_height = 400, 500
             else:
                 max_width, max_height = canvas_width, canvas_height
-            ratio = min(max_width / img_prev.width, max_height / img_prev.height)
-            if ratio <= 0 or ratio is None:
-                ratio = 1.0
-            new_width = int(img_prev.width * ratio)
-            new_height = int(img_prev.height * ratio)
-            resized_img = img_prev.resize(
-                (new_width, new_height), Image.Resampling.LANCZOS
+            stat = os.stat(img_path)
+            key = (
+                os.path.abspath(img_path), stat.st_mtime_ns, stat.st_size,
+                max_width, max_height,
             )
-            self.tk_img = ImageTk.PhotoImage(resized_img)
+            tk_img = self._image_previews.get(key)
+            if tk_img is None:
+                with Image.open(img_path) as img_prev:
+                    # thumbnail() keeps the aspect ratio and shrinks in place.
+                    # For JPEGs it first lets libjpeg decode at a reduced scale
+                    # (via draft()), and other images are reduce()d by whole
+                    # factors before the final filter, for which bilinear is
+                    # plenty at preview size.  Images smaller than the canvas
+                    # are shown at their natural size.
+                    img_prev.thumbnail((max_width, max_height), Image.Resampling.BILINEAR)
+                    tk_img = ImageTk.PhotoImage(img_prev)
+                self._image_previews[key] = tk_img
+                if len(self._image_previews) > 8:
+                    self._image_previews.popitem(last=False)
+            else:
+                self._image_previews.move_to_end(key)
+            self.tk_img = tk_img
+            new_width, new_height = tk_img.width(), tk_img.height()
             self.preview_canvas.delete("all")
             x = max(0, (max_width - new_width) // 2)
             y = max(0, (max_height - new_height) // 2)
@@ -1223,20 +2397,22 @@ class PDFToolkitApp:
             files = filedialog.askopenfilenames(filetypes=[("PDF Files", "*.pdf")])
         if not files:
             return
+        save_path = filedialog.asksaveasfilename(defaultextension=".pdf")
+        if not save_path:
+            return
+        self._run_bg(self._merge_pdfs_impl, list(files), save_path)
 
-        merger = PdfMerger()
-        try:
+    def _merge_pdfs_impl(self, files: List[str], save_path: str) -> None:
+        """Worker body for :meth:`merge_pdfs`; runs off the Tk thread."""
+        # MuPDF copies pages between already-parsed documents in C, which is
+        # much faster than PyPDF2 re-walking every object tree in Python
+        with fitz.open() as merged:
             for pdf in files:
-                merger.append(pdf)
-            save_path = filedialog.asksaveasfilename(defaultextension=".pdf")
-            if save_path:
-                merger.write(save_path)
-                messagebox.showinfo("Merged", f"Merged PDF saved as {save_path}")
-                self.preview_pdf_page(save_path)
-        except Exception as e:  # noqa: BLE001
-            messagebox.showerror("Error", str(e))
-        finally:
-            merger.close()
+                with fitz.open(pdf) as src:
+                    merged.insert_pdf(src)
+            merged.save(save_path, garbage=4, deflate=True)
+        self._ui(messagebox.showinfo, "Merged", f"Merged PDF saved as {save_path}")
+        self._ui(self.preview_pdf_page, save_path)
 
     def split_pdf(self) -> None:
         """Split a range of pages from a PDF into a new PDF file."""
@@ -1249,24 +2425,28 @@ class PDFToolkitApp:
         if not file:
             return
 
-        reader = PdfReader(file)
         start = simpledialog.askinteger("Start Page", "Enter start page (1-based):")
         end = simpledialog.askinteger("End Page", "Enter end page:")
         if start is None or end is None or start < 1 or end < start:
             messagebox.showwarning("Invalid input", "Please enter valid start and end pages.")
             return
-        try:
-            writer = PdfWriter()
-            for i in range(start - 1, min(end, len(reader.pages))):
-                writer.add_page(reader.pages[i])
-            save_path = filedialog.asksaveasfilename(defaultextension=".pdf")
-            if save_path:
-                with open(save_path, "wb") as f:
-                    writer.write(f)
-                messagebox.showinfo("Split", f"Pages saved as {save_path}")
-                self.preview_pdf_page(save_path)
-        except Exception as e:  # noqa: BLE001
-            messagebox.showerror("Error", str(e))
+        save_path = filedialog.asksaveasfilename(defaultextension=".pdf")
+        if not save_path:
+            return
+        self._run_bg(self._split_pdf_impl, file, start, end, save_path)
+
+    def _split_pdf_impl(self, file: str, start: int, end: int, save_path: str) -> None:
+        """Worker body for :meth:`split_pdf`; runs off the Tk thread."""
+        # Drop the other pages from the page tree in place; garbage=4 then
+        # writes only the objects the remaining pages still reference
+        with fitz.open(file) as doc:
+            last = min(end, doc.page_count)
+            if start > last:
+                raise ValueError(f"The PDF only has {doc.page_count} page(s).")
+            doc.select(list(range(start - 1, last)))
+            doc.save(save_path, garbage=4, deflate=True)
+        self._ui(messagebox.showinfo, "Split", f"Pages saved as {save_path}")
+        self._ui(self.preview_pdf_page, save_path)
 
     def rotate_pdf_pages(self) -> None:
         """
@@ -1294,8 +2474,9 @@ class PDFToolkitApp:
             if angle not in (90, 180, 270):
                 messagebox.showwarning("Invalid Angle", "Please enter 90, 180, or 270.")
                 return
-            reader = PdfReader(pdf_path)
-            total_pages = len(reader.pages)
+            total_pages = _pdf_page_count(pdf_path)
+            if total_pages is None:
+                raise ValueError("Unable to read the selected PDF.")
             # Ask for page range
             first_page_in = simpledialog.askinteger(
                 "Start Page",
@@ -1313,31 +2494,49 @@ class PDFToolkitApp:
             )
             if last_page_in is None:
                 last_page_in = total_pages
-            writer = PdfWriter()
-            for i, page in enumerate(reader.pages, start=1):
-                if first_page_in <= i <= last_page_in:
-                    rotated = page.rotate(angle)
-                    writer.add_page(rotated)
-                else:
-                    writer.add_page(page)
             save_path = os.path.splitext(pdf_path)[0] + f"_rotated{angle}.pdf"
             save_path = filedialog.asksaveasfilename(
                 initialfile=os.path.basename(save_path),
                 defaultextension=".pdf",
                 filetypes=[("PDF Files", "*.pdf")],
             )
-            if save_path:
-                with open(save_path, "wb") as f:
-                    writer.write(f)
-                messagebox.showinfo("Success", f"Rotated PDF saved as:\n{save_path}")
-                self.preview_pdf_page(save_path)
         except Exception as e:
             messagebox.showerror("Error", str(e))
+            return
+        if not save_path:
+            return
+        self._run_bg(
+            self._rotate_pdf_pages_impl,
+            pdf_path,
+            angle,
+            first_page_in,
+            last_page_in,
+            save_path,
+        )
+
+    def _rotate_pdf_pages_impl(
+        self,
+        pdf_path: str,
+        angle: int,
+        first_page_in: int,
+        last_page_in: int,
+        save_path: str,
+    ) -> None:
+        """Worker body for :meth:`rotate_pdf_pages`; runs off the Tk thread."""
+        # Only each page's /Rotate entry changes, so MuPDF rewrites the
+        # page dictionaries without touching their content streams
+        with fitz.open(pdf_path) as doc:
+            for i in range(first_page_in - 1, min(last_page_in, doc.page_count)):
+                page = doc[i]
+                page.set_rotation((page.rotation + angle) % 360)
+            doc.save(save_path, garbage=4, deflate=True)
+        self._ui(messagebox.showinfo, "Success", f"Rotated PDF saved as:\n{save_path}")
+        self._ui(self.preview_pdf_page, save_path)
 
     def encrypt_pdf(self) -> None:
         """
         Encrypt a PDF with a user-supplied password.
-        Uses PyPDF2 or pikepdf if available.
+        Uses pikepdf if available, otherwise PyMuPDF.
         """
         pdf_path = None
         dropped = self.get_dropped_files((".pdf",), multiple=False)
@@ -1352,33 +2551,32 @@ class PDFToolkitApp:
         )
         if not password:
             return
-        self.progress.start()
-        self.root.update()
-        try:
-            # Attempt with pikepdf if available (handles preservation of metadata)
-            if pikepdf is not None:
-                with pikepdf.Pdf.open(pdf_path) as pdf:
-                    output_path = os.path.splitext(pdf_path)[0] + "_encrypted.pdf"
-                    pdf.save(
-                        output_path,
-                        encryption=pikepdf.Encryption(owner=password, user=password),
-                    )
-            else:
-                reader = PdfReader(pdf_path)
-                writer = PdfWriter()
-                for page in reader.pages:
-                    writer.add_page(page)
-                writer.encrypt(user_pwd=password, owner_pwd=password)
+        self._run_bg(self._encrypt_pdf_impl, pdf_path, password)
+
+    def _encrypt_pdf_impl(self, pdf_path: str, password: str) -> None:
+        """Worker body for :meth:`encrypt_pdf`; runs off the Tk thread."""
+        pikepdf = _optional_import("pikepdf")
+        # Attempt with pikepdf if available (handles preservation of metadata)
+        if pikepdf is not None:
+            with pikepdf.Pdf.open(pdf_path) as pdf:
                 output_path = os.path.splitext(pdf_path)[0] + "_encrypted.pdf"
-                with open(output_path, "wb") as f:
-                    writer.write(f)
-            self.status_label.config(text=f"Encrypted: {os.path.basename(output_path)}")
-            messagebox.showinfo("Success", f"Encrypted PDF saved as:\n{output_path}")
-            self.preview_pdf_page(output_path)
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
-        finally:
-            self.progress.stop()
+                pdf.save(
+                    output_path,
+                    encryption=pikepdf.Encryption(owner=password, user=password),
+                )
+        else:
+            # MuPDF encrypts while saving, so no page-by-page copy is needed
+            output_path = os.path.splitext(pdf_path)[0] + "_encrypted.pdf"
+            with fitz.open(pdf_path) as doc:
+                doc.save(
+                    output_path,
+                    encryption=fitz.PDF_ENCRYPT_AES_256,
+                    owner_pw=password,
+                    user_pw=password,
+                )
+        self._ui(self.status_label.config, text=f"Encrypted: {os.path.basename(output_path)}")
+        self._ui(messagebox.showinfo, "Success", f"Encrypted PDF saved as:\n{output_path}")
+        self._ui(self.preview_pdf_page, output_path)
 
     def decrypt_pdf(self) -> None:
         """
@@ -1397,39 +2595,35 @@ class PDFToolkitApp:
         )
         if password is None:
             return
-        self.progress.start()
-        self.root.update()
-        try:
-            # Try with pikepdf first
-            if pikepdf is not None:
-                try:
-                    with pikepdf.Pdf.open(pdf_path, password=password) as pdf:
-                        output_path = os.path.splitext(pdf_path)[0] + "_decrypted.pdf"
-                        pdf.save(output_path)
-                except pikepdf.PasswordError:
-                    messagebox.showerror("Error", "Incorrect password or unable to decrypt.")
-                    return
-            else:
-                try:
-                    reader = PdfReader(pdf_path)
-                    if reader.is_encrypted:
-                        reader.decrypt(password)
-                    writer = PdfWriter()
-                    for page in reader.pages:
-                        writer.add_page(page)
+        self._run_bg(self._decrypt_pdf_impl, pdf_path, password)
+
+    def _decrypt_pdf_impl(self, pdf_path: str, password: str) -> None:
+        """Worker body for :meth:`decrypt_pdf`; runs off the Tk thread."""
+        pikepdf = _optional_import("pikepdf")
+        # Try with pikepdf first
+        if pikepdf is not None:
+            try:
+                with pikepdf.Pdf.open(pdf_path, password=password) as pdf:
                     output_path = os.path.splitext(pdf_path)[0] + "_decrypted.pdf"
-                    with open(output_path, "wb") as f:
-                        writer.write(f)
-                except Exception:
-                    messagebox.showerror("Error", "Incorrect password or unable to decrypt.")
-                    return
-            self.status_label.config(text=f"Decrypted: {os.path.basename(output_path)}")
-            messagebox.showinfo("Success", f"Decrypted PDF saved as:\n{output_path}")
-            self.preview_pdf_page(output_path)
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
-        finally:
-            self.progress.stop()
+                    pdf.save(output_path)
+            except pikepdf.PasswordError:
+                self._ui(messagebox.showerror, "Error", "Incorrect password or unable to decrypt.")
+                return
+        else:
+            # MuPDF writes the document without encryption by default, so
+            # authenticating and saving is enough
+            try:
+                with fitz.open(pdf_path) as doc:
+                    if doc.needs_pass and not doc.authenticate(password):
+                        raise ValueError("Incorrect password")
+                    output_path = os.path.splitext(pdf_path)[0] + "_decrypted.pdf"
+                    doc.save(output_path)
+            except Exception:
+                self._ui(messagebox.showerror, "Error", "Incorrect password or unable to decrypt.")
+                return
+        self._ui(self.status_label.config, text=f"Decrypted: {os.path.basename(output_path)}")
+        self._ui(messagebox.showinfo, "Success", f"Decrypted PDF saved as:\n{output_path}")
+        self._ui(self.preview_pdf_page, output_path)
 
     def add_watermark(self) -> None:
         """
@@ -1449,47 +2643,29 @@ class PDFToolkitApp:
         watermark_text = simpledialog.askstring("Watermark Text", "Enter the watermark text:")
         if not watermark_text:
             return
-        self.progress.start()
-        self.root.update()
-        try:
-            # Create a temporary watermark PDF in memory
-            import io
-            packet = io.BytesIO()
-            c = canvas.Canvas(packet, pagesize=reportlab_letter)
-            width, height = reportlab_letter
-            c.setFont("Helvetica", 40)
-            c.setFillColorRGB(0.6, 0.6, 0.6, alpha=0.3)  # semi-transparent grey
-            c.saveState()
-            # rotate text at an angle and center
-            c.translate(width / 2, height / 2)
-            c.rotate(45)
-            c.drawCentredString(0, 0, watermark_text)
-            c.restoreState()
-            c.showPage()
-            c.save()
-            packet.seek(0)
-            watermark_reader = PdfReader(packet)
-            watermark_page = watermark_reader.pages[0]
-            reader = PdfReader(pdf_path)
-            writer = PdfWriter()
-            for page in reader.pages:
-                page.merge_page(watermark_page)
-                writer.add_page(page)
-            save_path = os.path.splitext(pdf_path)[0] + "_watermarked.pdf"
-            save_path = filedialog.asksaveasfilename(
-                initialfile=os.path.basename(save_path),
-                defaultextension=".pdf",
-                filetypes=[("PDF Files", "*.pdf")],
-            )
-            if save_path:
-                with open(save_path, "wb") as f:
-                    writer.write(f)
-                messagebox.showinfo("Success", f"Watermarked PDF saved as:\n{save_path}")
-                self.preview_pdf_page(save_path)
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
-        finally:
-            self.progress.stop()
+        save_path = os.path.splitext(pdf_path)[0] + "_watermarked.pdf"
+        save_path = filedialog.asksaveasfilename(
+            initialfile=os.path.basename(save_path),
+            defaultextension=".pdf",
+            filetypes=[("PDF Files", "*.pdf")],
+        )
+        if not save_path:
+            return
+        self._run_bg(self._add_watermark_impl, pdf_path, watermark_text, save_path)
+
+    def _add_watermark_impl(self, pdf_path: str, watermark_text: str, save_path: str) -> None:
+        """Worker body for :meth:`add_watermark`; runs off the Tk thread."""
+        # Stamp the watermark page onto every page with MuPDF.  It is stored
+        # once as a form XObject that each page references, rather than
+        # merged into every page's content stream.
+        with fitz.open(stream=_watermark_pdf(watermark_text), filetype="pdf") as watermark:
+            with fitz.open(pdf_path) as doc:
+                for page in doc:
+                    page.show_pdf_page(page.rect, watermark, 0)
+                doc.save(save_path, garbage=3, deflate=True)
+        fitz.TOOLS.store_shrink(100)
+        self._ui(messagebox.showinfo, "Success", f"Watermarked PDF saved as:\n{save_path}")
+        self._ui(self.preview_pdf_page, save_path)
 
     def show_about(self) -> None:
         """
@@ -1524,16 +2700,7 @@ class PDFToolkitApp:
             return
 
         # Determine the number of pages to warn about large PDFs
-        try:
-            doc = fitz.open(pdf_path)
-            total_pages = doc.page_count
-        except Exception:
-            total_pages = None
-        finally:
-            try:
-                doc.close()
-            except Exception:
-                pass
+        total_pages = _pdf_page_count(pdf_path)
 
         # Prompt for page range if the PDF is large (more than 100 pages)
         first_page = 1
@@ -1567,28 +2734,81 @@ class PDFToolkitApp:
         elif total_pages is not None:
             last_page = total_pages
 
+        # Ask user for output directory
+        folder = filedialog.askdirectory()
+        if not folder:
+            return
+
+        # Ask the user how hard to compress the PNGs: level 1 is several
+        # times faster to write, level 9 gives the smallest files
+        compress_level = simpledialog.askinteger(
+            "PNG Compression",
+            "Enter PNG compression level (1 = fastest, 9 = smallest, default 6):",
+            minvalue=1,
+            maxvalue=9,
+        )
+        if compress_level is None:
+            compress_level = 6
+
         self.status_label.config(text=f"Selected: {os.path.basename(pdf_path)}")
-        try:
-            # Convert the specified page range to images
-            convert_kwargs = {
-                "pdf_path": pdf_path,
-                "dpi": 300,
-                "first_page": first_page,
-            }
-            if last_page is not None:
-                convert_kwargs["last_page"] = last_page
-            pages = convert_from_path(**convert_kwargs)
-            # Ask user for output directory
-            folder = filedialog.askdirectory()
-            if not folder:
-                return
-            for i, page in enumerate(pages, start=first_page):
-                page.save(os.path.join(folder, f"page_{i}.png"), "PNG")
-            messagebox.showinfo(
-                "Done", f"Saved {len(pages)} image(s)."
+        self._run_bg(
+            self._pdf_to_images_impl,
+            pdf_path,
+            first_page,
+            last_page,
+            folder,
+            compress_level,
+        )
+
+    def _pdf_to_images_impl(
+        self,
+        pdf_path: str,
+        first_page: int,
+        last_page: Optional[int],
+        folder: str,
+        compress_level: int = 6,
+    ) -> None:
+        """Worker body for :meth:`pdf_to_images`; runs off the Tk thread."""
+        # Pages render independently, so large ranges are split across
+        # worker processes (MuPDF is not thread-safe, so threads would not
+        # help).  Small ranges are rendered in-process.
+        MIN_PAGES_FOR_PARALLEL = 8
+        workers = max(1, (os.cpu_count() or 1) - 1)
+        start = first_page - 1
+        if (
+            last_page is not None
+            and workers > 1
+            and last_page - start > MIN_PAGES_FOR_PARALLEL
+        ):
+            total = last_page - start
+            saved = 0
+            # Several chunks per worker so progress updates arrive steadily
+            chunks = _page_chunks(start, last_page, workers * 4)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        _render_pages,
+                        pdf_path,
+                        chunk_start,
+                        chunk_stop,
+                        folder,
+                        compress_level=compress_level,
+                    )
+                    for chunk_start, chunk_stop in chunks
+                ]
+                for future in as_completed(futures):
+                    saved += future.result()
+                    self._ui(
+                        self.status_label.config,
+                        text=f"Saved {saved} of {total} page(s)",
+                    )
+        else:
+            saved = _render_pages(
+                pdf_path, start, last_page, folder, compress_level=compress_level
             )
-        except Exception as e:  # noqa: BLE001
-            messagebox.showerror("Error", str(e))
+        self._ui(
+            messagebox.showinfo, "Done", f"Saved {saved} image(s)."
+        )
 
     def batch_compress(self) -> None:
         """Compress multiple PDFs in one operation."""
@@ -1597,87 +2817,111 @@ class PDFToolkitApp:
             files = filedialog.askopenfilenames(filetypes=[("PDF Files", "*.pdf")])
         if not files:
             return
-        # Start the progress bar in indeterminate mode for batch processing
-        self.progress.start()
-        self.root.update()
-        try:
-            for pdf_path in files:
+        self._run_bg(self._batch_compress_impl, list(files))
+
+    def _batch_compress_impl(self, files: List[str]) -> None:
+        """Worker body for :meth:`batch_compress`; runs off the Tk thread."""
+        # Each file is independent and the work happens inside MuPDF, so
+        # compress files in separate processes.  More than four workers
+        # rarely helps on consumer machines and only adds memory pressure.
+        workers = min(os.cpu_count() or 1, 4, len(files))
+        done = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _compress_one,
+                    pdf_path,
+                    80,
+                    150,
+                    os.path.splitext(pdf_path)[0] + "_batch_compressed.pdf",
+                )
+                for pdf_path in files
+            ]
+            for future in as_completed(futures):
+                done += 1
                 try:
-                    input_size = os.path.getsize(pdf_path)
-                    output = os.path.splitext(pdf_path)[0] + "_batch_compressed.pdf"
-                    # Lossless attempt
-                    doc = fitz.open(pdf_path)
-                    doc.save(output, garbage=4, deflate=True)
-                    doc.close()
-                    out_size = os.path.getsize(output)
-                    # Fallback to lossy downsample if necessary
-                    if out_size >= input_size:
-                        import io
-                        from PIL import Image
-                        doc = fitz.open(pdf_path)
-                        for page in doc:
-                            zoom = 150 / 72.0
-                            mat = fitz.Matrix(zoom, zoom)
-                            pix = page.get_pixmap(matrix=mat)  # type: ignore[attr-defined]
-                            img = Image.frombytes(
-                                "RGB", (pix.width, pix.height), pix.samples
-                            )
-                            buf = io.BytesIO()
-                            img.save(buf, format="JPEG", quality=80)
-                            page.clean_contents()
-                            page.insert_image(page.rect, stream=buf.getvalue())  # type: ignore[attr-defined]
-                        doc.save(output)
-                        doc.close()
+                    future.result()
                 except Exception:
                     # Skip file on error
-                    continue
-            messagebox.showinfo("Done", "Batch compression complete.")
-        except Exception as e:  # noqa: BLE001
-            messagebox.showerror("Error", str(e))
-        finally:
-            self.progress.stop()
+                    pass
+                self._set_progress(done, len(files))
+                self._ui(
+                    self.status_label.config,
+                    text=f"Compressed {done} of {len(files)} file(s)",
+                )
+        self._ui(messagebox.showinfo, "Done", "Batch compression complete.")
 
     def preview_pdf_page(self, pdf_path: str) -> None:
         """
         Display a preview of the first page of the given PDF.
 
-        Uses pdf2image to render the first page at a moderate DPI, then
-        resizes it for display in the preview canvas.  The resulting image
-        remains in memory as an attribute (tk_img) to prevent garbage collection.
+        Uses PyMuPDF to render the first page directly at the size that
+        fits the preview canvas, so no separate resize step is needed.  The
+        rendered page is cached as a PNG under :data:`PREVIEW_CACHE_DIR`,
+        keyed by the file's path, modification time, size and the canvas
+        size, so previewing an unchanged file again skips the render.  The
+        resulting image remains in memory as an attribute (tk_img) to
+        prevent garbage collection.
         """
         try:
-            images = convert_from_path(pdf_path, dpi=150, first_page=1, last_page=1)
-            if images:
-                img = images[0]
-                # Determine available canvas size for scaling
-                self.root.update_idletasks()
-                canvas_width = self.preview_canvas.winfo_width()
-                canvas_height = self.preview_canvas.winfo_height()
-                # Provide sensible defaults in case geometry is not yet updated
-                if canvas_width <= 10 or canvas_height <= 10:
-                    max_width, max_height = 400, 500
-                else:
-                    max_width, max_height = canvas_width, canvas_height
-                # Compute scaling ratio
-                ratio = min(max_width / img.width, max_height / img.height)
-                # Avoid division by zero
-                if ratio <= 0 or ratio is None:
-                    ratio = 1.0
-                new_width = int(img.width * ratio)
-                new_height = int(img.height * ratio)
-                # Resize the image to fit within the canvas
-                resized_img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                self.tk_img = ImageTk.PhotoImage(resized_img)
-                self.preview_canvas.delete("all")
-                # Center the image within the canvas
-                x = max(0, (max_width - new_width) // 2)
-                y = max(0, (max_height - new_height) // 2)
-                self.preview_canvas.create_image(x, y, anchor="nw", image=self.tk_img)
-                # Update scrollregion so that scrollbars reflect the drawn content
-                self.preview_canvas.config(scrollregion=self.preview_canvas.bbox("all"))
-                # Reset the scroll position to the top-left
-                self.preview_canvas.xview_moveto(0)
-                self.preview_canvas.yview_moveto(0)
+            # Determine available canvas size for scaling
+            self.root.update_idletasks()
+            canvas_width = self.preview_canvas.winfo_width()
+            canvas_height = self.preview_canvas.winfo_height()
+            # Provide sensible defaults in case geometry is not yet updated
+            if canvas_width <= 10 or canvas_height <= 10:
+                max_width, max_height = 400, 500
+            else:
+                max_width, max_height = canvas_width, canvas_height
+            stat = os.stat(pdf_path)
+            key = hashlib.sha1(
+                f"{os.path.abspath(pdf_path)}|{stat.st_mtime_ns}|{stat.st_size}|"
+                f"{max_width}x{max_height}".encode("utf-8")
+            ).hexdigest()
+            cache_path = os.path.join(PREVIEW_CACHE_DIR, f"{key}.png")
+            if os.path.exists(cache_path):
+                with Image.open(cache_path) as cached:
+                    img = cached.convert("RGB")
+                # Mark the entry as recently used for pruning
+                try:
+                    os.utime(cache_path)
+                except OSError:
+                    pass
+            else:
+                with fitz.open(pdf_path) as doc:
+                    if doc.page_count == 0:
+                        return
+                    page = doc.load_page(0)
+                    # Compute the zoom that fits the page (in points) to the canvas
+                    zoom = min(max_width / page.rect.width, max_height / page.rect.height)
+                    # Avoid a degenerate zoom factor
+                    if zoom <= 0:
+                        zoom = 1.0
+                    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+                    # Wrap MuPDF's pixel buffer without copying it; pix stays
+                    # referenced until PhotoImage has copied the pixels into Tk
+                    img = Image.frombuffer(
+                        "RGB", (pix.width, pix.height), pix.samples_mv, "raw", "RGB", pix.stride, 1
+                    )
+                try:
+                    os.makedirs(PREVIEW_CACHE_DIR, exist_ok=True)
+                    # Fast zlib level: these are small, short-lived thumbnails
+                    img.save(cache_path, format="PNG", compress_level=1)
+                    _prune_cache(PREVIEW_CACHE_DIR, PREVIEW_CACHE_MAX_BYTES)
+                except OSError:
+                    # The cache is only an optimisation
+                    pass
+            self.tk_img = ImageTk.PhotoImage(img)
+            self.preview_canvas.delete("all")
+            # Center the image within the canvas
+            x = max(0, (max_width - img.width) // 2)
+            y = max(0, (max_height - img.height) // 2)
+            self.preview_canvas.create_image(x, y, anchor="nw", image=self.tk_img)
+            # Update scrollregion so that scrollbars reflect the drawn content
+            self.preview_canvas.config(scrollregion=self.preview_canvas.bbox("all"))
+            # Reset the scroll position to the top-left
+            self.preview_canvas.xview_moveto(0)
+            self.preview_canvas.yview_moveto(0)
         except Exception as e:  # noqa: BLE001
             self.status_label.config(text=f"Preview unavailable: {e}")
 
@@ -1685,9 +2929,9 @@ class PDFToolkitApp:
         """
         Merge multiple images into a single PDF.
 
-        This function recompresses each selected image into JPEG format
-        (quality 85) before embedding them into a single PDF using
-        ``img2pdf``.  Supporting many common image formats ensures broad
+        JPEG files are handed to ``img2pdf`` by path and embedded as-is;
+        every other image is recompressed into JPEG format (quality 85)
+        first.  Supporting many common image formats ensures broad
         compatibility.  The resulting PDF is previewed once written.
         """
         allowed_exts = (
@@ -1713,55 +2957,46 @@ class PDFToolkitApp:
             return
 
         self.status_label.config(text=f"Selected {len(img_paths)} image(s)")
-        self.progress.start()
-        self.root.update()
-        try:
-            save_path = filedialog.asksaveasfilename(
-                defaultextension=".pdf", filetypes=[("PDF File", "*.pdf")]
-            )
-            if not save_path:
-                return
-            import io
-            compressed_images: List[io.BytesIO] = []
-            for img_path in img_paths:
-                try:
-                    img = Image.open(img_path)
-                    if img.mode not in ("RGB", "L"):
-                        img = img.convert("RGB")
-                    buf = io.BytesIO()
-                    img.save(buf, format="JPEG", quality=85)
-                    buf.seek(0)
-                    compressed_images.append(buf)
-                except Exception:
-                    continue
-            if not compressed_images:
-                messagebox.showwarning(
-                    "No Images", "No valid images to merge."
-                )
-                return
-            with open(save_path, "wb") as f:
-                f.write(img2pdf.convert(compressed_images))
-            self.status_label.config(
-                text=f"Saved as: {os.path.basename(save_path)}"
+        save_path = filedialog.asksaveasfilename(
+            defaultextension=".pdf", filetypes=[("PDF File", "*.pdf")]
+        )
+        if not save_path:
+            return
+        self._run_bg(self._merge_images_to_pdf_impl, list(img_paths), save_path)
+
+    def _merge_images_to_pdf_impl(self, img_paths: List[str], save_path: str) -> None:
+        """Worker body for :meth:`merge_images_to_pdf`; runs off the Tk thread."""
+        import img2pdf
+        compressed_images = _images_for_pdf(img_paths)
+        if not compressed_images:
+            self._ui(
+                messagebox.showwarning, "No Images", "No valid images to merge."
             )
-            self.preview_pdf_page(save_path)
-            messagebox.showinfo(
-                "Success", f"Merged PDF saved as {save_path}"
+            return
+        with open(save_path, "wb") as f:
+            img2pdf.convert(
+                compressed_images, outputstream=f, rotation=img2pdf.Rotation.ifvalid
             )
-        except Exception as e:  # noqa: BLE001
-            messagebox.showerror("Error", str(e))
-        finally:
-            self.progress.stop()
+        self._ui(
+            self.status_label.config,
+            text=f"Saved as: {os.path.basename(save_path)}",
+        )
+        self._ui(self.preview_pdf_page, save_path)
+        self._ui(
+            messagebox.showinfo, "Success", f"Merged PDF saved as {save_path}"
+        )
 
     def compress_images(self) -> None:
         """
-        Compress one or more image files using preset quality and scaling values.
+        Compress one or more image files using a preset quality and a chosen scale.
 
         This method prompts the user to select multiple images (PNG, JPEG, BMP,
-        TIFF, GIF, ICO, WEBP, etc.) and then compresses each one using a
-        predefined JPEG quality (75%) and scaling factor (100%, i.e., no
-        resizing). Images are converted to RGB if necessary, then saved as
-        JPEGs alongside the originals with a ``_compressed`` suffix.
+        TIFF, GIF, ICO, WEBP, etc.) and a scaling factor (default 100%, i.e.,
+        no resizing), then compresses each one using a predefined JPEG
+        quality (75%). The quality is lowered further, down to 55%, for images
+        that still keep an SSIM of at least 0.95. Images are converted to RGB
+        if necessary, then saved as JPEGs alongside the originals with a
+        ``_compressed`` suffix.
 
         Unsupported or unreadable files are silently skipped, and a preview of
         the first compressed image is displayed in the preview pane.
@@ -1790,88 +3025,88 @@ class PDFToolkitApp:
             return
 
         # Use default compression settings
-        quality = 75  # JPEG quality percentage
-        scale = 100   # Scaling percentage (100% = no scaling)
+        quality = 75  # Highest JPEG quality percentage
+        target_ssim = 0.95  # Lower the quality only while SSIM stays above this
+
+        # Ask the user how far to scale the images down (10–100%).  Smaller
+        # scales also let JPEGs be decoded at a reduced size, which is faster.
+        scale = simpledialog.askinteger(
+            "Image Scale",
+            "Enter scaling percentage (10–100, default 100 = no resizing):",
+            minvalue=10,
+            maxvalue=100,
+        )
+        if scale is None:
+            scale = 100
 
         self.status_label.config(
             text=f"Selected {len(img_paths)} image(s) for compression"
         )
-        self.progress.start()
-        self.root.update()
-        try:
-            compressed_count = 0
-            for path in img_paths:
+        self._run_bg(
+            self._compress_images_impl,
+            list(img_paths),
+            quality,
+            scale,
+            target_ssim,
+            self.optimize_jpeg.get(),
+        )
+
+    def _compress_images_impl(
+        self,
+        img_paths: List[str],
+        quality: int,
+        scale: int,
+        target_ssim: float,
+        optimize: bool = False,
+    ) -> None:
+        """Worker body for :meth:`compress_images`; runs off the Tk thread."""
+        # Pillow releases the GIL while decoding, resizing and encoding, so
+        # images are compressed on a thread pool.  Each thread keeps one
+        # encode buffer that it rewinds and reuses for every image.
+        local = threading.local()
+
+        def compress(path: str) -> str:
+            buf = getattr(local, "buf", None)
+            if buf is None:
+                buf = local.buf = io.BytesIO()
+            return _compress_image(
+                path, quality, scale, buf, target_ssim, optimize=optimize
+            )
+
+        compressed_count = 0
+        workers = max(1, min(os.cpu_count() or 1, len(img_paths)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(compress, path) for path in img_paths]
+            for finished, future in enumerate(as_completed(futures), 1):
+                self._set_progress(finished, len(img_paths))
                 try:
-                    img = Image.open(path)
-                    # Convert images with alpha or palette to RGB for JPEG compression
-                    if img.mode not in ("RGB", "L"):
-                        img = img.convert("RGB")
-                    # Apply scaling if necessary
-                    if scale != 100:
-                        new_size = (
-                            max(1, int(img.width * scale / 100)),
-                            max(1, int(img.height * scale / 100)),
-                        )
-                        img = img.resize(new_size, Image.Resampling.LANCZOS)
-                    base, _ = os.path.splitext(path)
-                    out_path = f"{base}_compressed.jpg"
-                    # Save as JPEG with specified quality
-                    img.save(out_path, format="JPEG", quality=quality, optimize=True)
-                    compressed_count += 1
+                    future.result()
                 except Exception:
                     # Ignore unreadable/unsupported files
                     continue
-            if compressed_count > 0:
-                messagebox.showinfo(
-                    "Success", f"Compressed {compressed_count} image(s)."
+                compressed_count += 1
+                self._ui(
+                    self.status_label.config,
+                    text=f"Compressed {compressed_count} of {len(img_paths)} image(s)",
                 )
-                # Preview the first compressed image using dynamic scaling
-                first_base, _ = os.path.splitext(img_paths[0])
-                first_out = f"{first_base}_compressed.jpg"
-                if os.path.exists(first_out):
-                    try:
-                        img_prev = Image.open(first_out)
-                        # Determine available canvas size for scaling
-                        self.root.update_idletasks()
-                        canvas_width = self.preview_canvas.winfo_width()
-                        canvas_height = self.preview_canvas.winfo_height()
-                        # Provide sensible defaults if geometry isn't ready
-                        if canvas_width <= 10 or canvas_height <= 10:
-                            max_width, max_height = 400, 500
-                        else:
-                            max_width, max_height = canvas_width, canvas_height
-                        # Compute scaling ratio to fit image within the canvas
-                        ratio = min(max_width / img_prev.width, max_height / img_prev.height)
-                        # Avoid invalid ratio
-                        if ratio <= 0 or ratio is None:
-                            ratio = 1.0
-                        new_width = int(img_prev.width * ratio)
-                        new_height = int(img_prev.height * ratio)
-                        resized_img = img_prev.resize(
-                            (new_width, new_height), Image.Resampling.LANCZOS
-                        )
-                        self.tk_img = ImageTk.PhotoImage(resized_img)
-                        self.preview_canvas.delete("all")
-                        # Center the image within the canvas
-                        x = max(0, (max_width - new_width) // 2)
-                        y = max(0, (max_height - new_height) // 2)
-                        self.preview_canvas.create_image(x, y, anchor="nw", image=self.tk_img)
-                        # Update scrollregion and reset the scroll position
-                        self.preview_canvas.config(scrollregion=self.preview_canvas.bbox("all"))
-                        self.preview_canvas.xview_moveto(0)
-                        self.preview_canvas.yview_moveto(0)
-                    except Exception:
-                        pass
-                self.status_label.config(text="Image compression complete")
-            else:
-                messagebox.showwarning("No Images", "No valid images were compressed.")
-        except Exception as e:  # noqa: BLE001
-            messagebox.showerror("Error", str(e))
-        finally:
-            self.progress.stop()
-
+        if compressed_count > 0:
+            self._ui(
+                messagebox.showinfo, "Success", f"Compressed {compressed_count} image(s)."
+            )
+            # Preview the first compressed image on the Tk thread
+            first_base, _ = os.path.splitext(img_paths[0])
+            first_out = f"{first_base}_compressed.jpg"
+            if os.path.exists(first_out):
+                self._ui(self.preview_image_file, first_out)
+            self._ui(self.status_label.config, text="Image compression complete")
+        else:
+            self._ui(
+                messagebox.showwarning, "No Images", "No valid images were compressed."
+            )
 
 if __name__ == "__main__":
+    # Required for process pools in the frozen (PyInstaller) Windows build
+    freeze_support()
     root = tk.Tk()
     app = PDFToolkitApp(root)
     root.mainloop()
\ No newline at end of file
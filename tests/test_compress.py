@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+pytest.importorskip("PIL")
+pytest.importorskip("tkinter")
+
+import pdftoolkitapp  # noqa: E402
+
+PAGES = 12
+SIZE = 300
+
+
+def _make_scan_pdf(path):
+    """Write a PDF of noise "scans" saved with object streams."""
+    with fitz.open() as doc:
+        for i in range(PAGES):
+            page = doc.new_page(width=SIZE, height=SIZE)
+            noise = random.Random(i).randbytes(SIZE * SIZE * 3)
+            pix = fitz.Pixmap(fitz.csRGB, SIZE, SIZE, noise, False)
+            page.insert_image(page.rect, stream=pix.tobytes("png"))
+            page.insert_text((20, 20), f"page {i + 1}")
+        doc.save(path, garbage=4, deflate=True, use_objstms=1)
+
+
+def _page_image_exts(path):
+    with fitz.open(path) as doc:
+        exts = []
+        for page in doc:
+            xrefs = {image[0] for image in page.get_images()}
+            assert len(xrefs) == 1
+            exts.append(doc.extract_image(xrefs.pop())["ext"])
+        return exts
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_lossy_pass_on_object_stream_input(tmp_path, monkeypatch, workers):
+    # Keep pikepdf out so the lossy pass is always reached
+    monkeypatch.setattr(pdftoolkitapp, "_optional_import", lambda name: None)
+    src = str(tmp_path / "scan.pdf")
+    out = str(tmp_path / "out.pdf")
+    _make_scan_pdf(src)
+
+    in_size, out_size, out_path, skipped = pdftoolkitapp._compress_one(
+        src, quality=60, dpi=72, output_path=out, workers=workers
+    )
+
+    assert not skipped
+    assert out_path == out
+    assert out_size < in_size
+    # Every scanned page had its own image replaced by a JPEG
+    assert _page_image_exts(out) == ["jpeg"] * PAGES
+
+
+def test_lossy_pass_drops_replaced_page_resources(tmp_path, monkeypatch):
+    monkeypatch.setattr(pdftoolkitapp, "_optional_import", lambda name: None)
+    src = str(tmp_path / "mixed.pdf")
+    out = str(tmp_path / "out.pdf")
+    with fitz.open() as doc:
+        for i in range(3):
+            # The image covers less than the page, so it is not a scan
+            page = doc.new_page(width=SIZE * 2, height=SIZE * 2)
+            noise = random.Random(i).randbytes(SIZE * SIZE * 3)
+            pix = fitz.Pixmap(fitz.csRGB, SIZE, SIZE, noise, False)
+            page.insert_image(fitz.Rect(0, 0, SIZE, SIZE), stream=pix.tobytes("png"))
+            page.insert_text((20, SIZE + 40), f"page {i + 1}")
+        doc.save(src, garbage=4, deflate=True, use_objstms=1)
+
+    in_size, out_size, _, skipped = pdftoolkitapp._compress_one(
+        src, quality=60, dpi=72, output_path=out, workers=1
+    )
+
+    assert not skipped
+    assert out_size < in_size
+    # Only the page raster is left; the original image was collected
+    assert _page_image_exts(out) == ["jpeg"] * 3
@@ -0,0 +1,69 @@
+import datetime
+import re
+import zipfile
+
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+pytest.importorskip("fitz")
+pytest.importorskip("PIL")
+pytest.importorskip("tkinter")
+
+import pdftoolkitapp  # noqa: E402
+
+
+def test_xlsx_dates_keep_their_old_format(tmp_path):
+    path = str(tmp_path / "dates.xlsx")
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Dates"
+    ws.append(["day", "stamp", "count"])
+    ws.append([datetime.date(2024, 1, 5), datetime.datetime(2024, 1, 5, 10, 30), 3])
+    wb.save(path)
+
+    sheets = pdftoolkitapp._read_sheets(path)
+
+    assert sheets == [
+        (
+            "Dates",
+            [["day", "stamp", "count"], ["2024-01-05", "2024-01-05 10:30:00", "3"]],
+            [10, 19, 5],
+        )
+    ]
+
+
+def test_xlsx_stale_dimension_does_not_drop_cells(tmp_path):
+    path = str(tmp_path / "stale.xlsx")
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["a", "b", "c"])
+    ws.append([1, 2, 3])
+    ws.append([4, 5, 6])
+    wb.save(str(tmp_path / "good.xlsx"))
+    # Rewrite the sheet's stored <dimension> to cover only A1:B2
+    with zipfile.ZipFile(str(tmp_path / "good.xlsx")) as src, zipfile.ZipFile(path, "w") as dst:
+        for item in src.infolist():
+            data = src.read(item.filename)
+            if item.filename == "xl/worksheets/sheet1.xml":
+                data = re.sub(rb'<dimension ref="[^"]*"', b'<dimension ref="A1:B2"', data)
+            dst.writestr(item, data)
+
+    sheets = pdftoolkitapp._read_sheets(path)
+
+    assert sheets[0][1] == [["a", "b", "c"], ["1", "2", "3"], ["4", "5", "6"]]
+
+
+def test_xlsx_formatted_empty_columns_are_trimmed(tmp_path):
+    path = str(tmp_path / "formatted.xlsx")
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["a", "b", "c"])
+    ws.append([1, 2, 3])
+    ws["F1"].font = openpyxl.styles.Font(bold=True)
+    wb.save(path)
+
+    sheets = pdftoolkitapp._read_sheets(path)
+
+    assert sheets == [("Data", [["a", "b", "c"], ["1", "2", "3"]], [1, 1, 1])]